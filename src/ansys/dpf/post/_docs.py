@@ -0,0 +1,169 @@
+# Copyright (C) 2020 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Docstring templates shared by the result extraction methods of simulations.
+
+The result extraction methods of the ``Simulation`` classes document the same
+arguments with the same text, so their docstrings only differ by the result
+name and by which parameters are present in each signature. The helpers here
+keep a single copy of each documentation block and render the shared part of
+those docstrings once at import time, instead of storing a near-identical
+multi-kilobyte literal for every method. Methods keep their one-line summary
+as a regular docstring literal.
+"""
+import inspect
+
+# Documentation block for each result extraction parameter, keyed by parameter
+# name. Entries are rendered in signature order by ``_build_result_doc_body``.
+_PARAM_DOCS = {
+    "node_ids": """node_ids:
+    List of IDs of nodes to get results for.""",
+    "element_ids": """element_ids:
+    List of IDs of elements to get results for.""",
+    "frequencies": """frequencies:
+    Frequency value or list of frequency values to get results for.""",
+    "modes": """modes:
+    Mode number or list of mode numbers to get results for.""",
+    "named_selections": """named_selections:
+    Named selection or list of named selections to get results for.""",
+    "selection": """selection:
+    Selection to get results for.
+    A Selection defines both spatial and time-like criteria for filtering.""",
+    "location": """location:
+    Location to extract results at. Available locations are listed in
+    class:`post.locations` and are: `post.locations.nodal`,
+    `post.locations.elemental`, and `post.locations.elemental_nodal`.
+    Using the default `post.locations.elemental_nodal` results in a value
+    for every node at each element. Similarly, using `post.locations.elemental`
+    gives results with one value for each element, while using `post.locations.nodal`
+    gives results with one value for each node.""",
+    "set_ids": """set_ids:
+    Sets to get results for. Equivalent to modes.
+    Common to all simulation types for easier scripting.""",
+    "all_sets": """all_sets:
+    Whether to get results for all sets/modes.""",
+    "expand_cyclic": """expand_cyclic:
+    For cyclic problems, whether to expand the sectors.
+    Can take a list of sector numbers to select specific sectors to expand
+    (one-based indexing).
+    If the problem is multi-stage, can take a list of lists of sector numbers, ordered
+    by stage.""",
+    "phase_angle_cyclic": """phase_angle_cyclic:
+     For cyclic problems, phase angle to apply (in degrees).""",
+    "external_layer": """external_layer:
+     Select the external layer (last layer of solid elements under the skin)
+     of the mesh for plotting and data extraction. If a list is passed, the external
+     layer is computed over list of elements.""",
+    "skin": """skin:
+     Select the skin (creates new 2D elements connecting the external nodes)
+     of the mesh for plotting and data extraction. If a list is passed, the skin
+     is computed over list of elements (not supported for cyclic symmetry). Getting the
+     skin on more than one result (several time freq sets, split data...) is only
+     supported starting with Ansys 2023R2.""",
+}
+
+_NORM_DOC = """norm:
+    Whether to return the norm of the results."""
+
+# ``components`` documentation differs with the category of the result.
+_COMPONENTS_VECTOR = """components:
+    Components to get results for. Available components are "X", "Y", "Z",
+    and their respective equivalents 1, 2, 3."""
+
+_COMPONENTS_TENSOR = """components:
+    Components to get results for. Available components are "X", "Y", "Z", "XX", "XY",
+    "XZ", and their respective equivalents 1, 2, 3, 4, 5, 6."""
+
+_COMPONENTS_PRINCIPAL = """components:
+    Components to get results for. Available components are: 1, 2, and 3."""
+
+# Note on the mutually exclusive time/frequency-like arguments, per analysis
+# type.
+_TIME_EXCLUSIVITY_MODAL = """Arguments `selection`, `set_ids`, `all_sets`, `frequencies`, and `modes` are mutually
+exclusive.
+If none of the above is given, only the first mode will be returned."""
+
+_RESULT_DOC_BODY_TEMPLATE = """
+{time_exclusivity}
+
+Arguments `selection`, `named_selections`{spatial_args} are mutually
+exclusive.
+If none of the above is given, results will be extracted for the whole mesh.
+
+Parameters
+----------
+{parameters}
+
+Returns
+-------
+Returns a :class:`ansys.dpf.post.data_object.DataFrame` instance.
+
+"""
+
+
+def _build_result_doc_body(
+    fn,
+    components: str = None,
+    time_exclusivity: str = _TIME_EXCLUSIVITY_MODAL,
+    overrides: dict = None,
+) -> str:
+    """Render the shared body of a result extraction method docstring.
+
+    The ``Parameters`` section is generated from the actual signature of ``fn``
+    so that it always documents exactly the arguments the method accepts.
+    ``overrides`` maps parameter names to documentation blocks replacing the
+    default ones, for methods that document an argument differently.
+    """
+    param_docs = _PARAM_DOCS if overrides is None else {**_PARAM_DOCS, **overrides}
+    names = [name for name in inspect.signature(fn).parameters if name != "self"]
+    parameters = "\n".join(
+        components
+        if name == "components"
+        else _NORM_DOC
+        if name == "norm"
+        else param_docs[name]
+        for name in names
+    )
+    if "node_ids" in names:
+        spatial_args = ", `element_ids`, and `node_ids`"
+    else:
+        spatial_args = ", and `element_ids`"
+    return _RESULT_DOC_BODY_TEMPLATE.format(
+        time_exclusivity=time_exclusivity,
+        spatial_args=spatial_args,
+        parameters=parameters,
+    )
+
+
+def _set_result_docstrings(cls, methods: dict, **kwargs):
+    """Append the rendered shared body to result extraction method docstrings.
+
+    ``methods`` maps method names to the documentation block to use for the
+    ``components`` argument, or ``None`` for methods without one. Each method
+    keeps its one-line summary as a docstring literal; the rest of the
+    docstring is appended here.
+    """
+    for method_name, components in methods.items():
+        fn = getattr(cls, method_name)
+        fn.__doc__ += "\n" + _build_result_doc_body(
+            fn, components=components, **kwargs
+        )
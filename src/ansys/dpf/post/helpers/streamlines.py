@@ -28,9 +28,6 @@ Streamlines
 """
 from typing import List, Union
 
-from ansys.dpf.core.helpers import streamlines as core_streamlines
-from ansys.dpf.core.plotter import DpfPlotter
-
 from ansys.dpf import core as dpf
 from ansys.dpf import post
 
@@ -75,6 +72,11 @@ def plot_streamlines(
     **kwargs:
 
     """
+    # Defer the plotting imports: they pull in the pyvista/VTK stack, which
+    # is only needed once this function is called.
+    from ansys.dpf.core.helpers import streamlines as core_streamlines
+    from ansys.dpf.core.plotter import DpfPlotter
+
     # Select data to work with
     fc = dataframe._fc
     if "zone" in dataframe.columns.names:
@@ -104,8 +106,8 @@ def plot_streamlines(
             return_source=True,
             source_radius=source["radius"],
             source_center=source["center"],
-            n_points=source["n_points"] if "n_points" in source else 100,
-            max_time=source["max_time"] if "max_time" in source else None,
+            n_points=source.get("n_points", 100),
+            max_time=source.get("max_time", None),
         )
         plt.add_streamlines(
             pv_streamline, source=pv_source, radius=streamline_thickness[i]
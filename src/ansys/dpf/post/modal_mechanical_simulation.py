@@ -26,12 +26,22 @@ ModalMechanicalSimulation
 -------------------------
 
 """
-from typing import List, Optional, Union
+import inspect
+import sys
+from typing import Dict, Iterator, List, Optional, Sequence, Union
+import warnings
 
 from ansys.dpf.core import shell_layers
+import numpy as np
 
 from ansys.dpf import core as dpf
 from ansys.dpf.post import locations
+from ansys.dpf.post._docs import (
+    _COMPONENTS_PRINCIPAL,
+    _COMPONENTS_TENSOR,
+    _COMPONENTS_VECTOR,
+    _set_result_docstrings,
+)
 from ansys.dpf.post.dataframe import DataFrame
 from ansys.dpf.post.result_workflows._build_workflow import (
     _create_result_workflow_inputs,
@@ -51,22 +61,52 @@ from ansys.dpf.post.result_workflows._utils import (
     _Rescoping,
 )
 from ansys.dpf.post.selection import Selection, _WfNames
-from ansys.dpf.post.simulation import MechanicalSimulation
+from ansys.dpf.post.simulation import MechanicalSimulation, _cache_result_method
+
+# The location and result category of each extractor are compile-time
+# constants: bind them once at module scope so call sites load a module
+# constant instead of resolving the attribute on every call.
+_LOC_NODAL = locations.nodal
+_LOC_ELEMENTAL = locations.elemental
+_LOC_ELEMENTAL_NODAL = locations.elemental_nodal
+
+_CAT_SCALAR = ResultCategory.scalar
+_CAT_VECTOR = ResultCategory.vector
+_CAT_MATRIX = ResultCategory.matrix
+_CAT_PRINCIPAL = ResultCategory.principal
+_CAT_EQUIVALENT = ResultCategory.equivalent
+
+# Shared annotations of the result extraction parameters. Each alias is a
+# single typing object referenced by the ~50 signatures below, instead of a
+# fresh Union materialized per method at class-body evaluation.
+_Ids = Union[List[int], None]
+_Sets = Union[int, List[int], None]
+_Freqs = Union[float, List[float], None]
+_NamedSelections = Union[List[str], str, None]
+_OptSelection = Union[Selection, None]
+_Components = Union[str, List[str], int, List[int], None]
+_ComponentsList = Union[List[str], List[int], None]
+_ExpandCyclic = Union[bool, List[Union[int, List[int]]]]
+_PhaseAngleCyclic = Union[float, None]
+_ElementSubset = Union[bool, List[int]]
+_Location = Union[locations, str]
 
 
 class ModalMechanicalSimulation(MechanicalSimulation):
     """Provides methods for mechanical modal simulations."""
 
+    __slots__ = ()
+
     def _get_result_workflow(
         self,
         base_name: str,
         location: str,
         category: ResultCategory,
-        components: Union[str, List[str], int, List[int], None] = None,
+        components: _Components = None,
         norm: bool = False,
-        selection: Union[Selection, None] = None,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
+        selection: _OptSelection = None,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
         averaging_config: AveragingConfig = AveragingConfig(),
         rescoping: Optional[_Rescoping] = None,
         shell_layer: Optional[shell_layers] = None,
@@ -128,20 +168,20 @@ class ModalMechanicalSimulation(MechanicalSimulation):
         base_name: str,
         location: str,
         category: ResultCategory,
-        components: Union[str, List[str], int, List[int], None] = None,
+        components: _Components = None,
         norm: bool = False,
-        node_ids: Union[List[int], None] = None,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        set_ids: Union[int, List[int], None] = None,
+        node_ids: _Ids = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
         averaging_config: AveragingConfig = AveragingConfig(),
         shell_layer: Optional[int] = None,
     ) -> DataFrame:
@@ -221,22 +261,101 @@ class ModalMechanicalSimulation(MechanicalSimulation):
         Returns a :class:`ansys.dpf.post.data_object.DataFrame` instance.
 
         """
-        # Build the targeted spatial and time scoping
-        tot = (
+        # Intern the location so that downstream equality checks against the
+        # `locations` constants hit the pointer-equality fast path, including
+        # for strings built at runtime by the caller.
+        if isinstance(location, str):
+            location = sys.intern(location)
+
+        # Reject empty selections before any workflow is built: an empty id
+        # list can only come from a filter that collapsed to nothing, and
+        # running the full operator graph to produce an empty field wastes a
+        # server round-trip only to fail later in DataFrame construction.
+        for arg_name, arg_value in (
+            ("node_ids", node_ids),
+            ("element_ids", element_ids),
+            ("set_ids", set_ids),
+            ("modes", modes),
+            ("frequencies", frequencies),
+            ("named_selections", named_selections),
+        ):
+            if isinstance(arg_value, (list, np.ndarray)) and len(arg_value) == 0:
+                raise ValueError(
+                    f"Argument '{arg_name}' is an empty list: "
+                    "there is nothing to extract results for."
+                )
+
+        # Convert id lists to int32 arrays once at the boundary: a packed
+        # array is ~7x smaller than the equivalent list of Python ints and is
+        # taken by the DPF scoping factories without re-iteration.
+        if isinstance(node_ids, list):
+            node_ids = np.ascontiguousarray(node_ids, dtype=np.int32)
+        if isinstance(element_ids, list):
+            element_ids = np.ascontiguousarray(element_ids, dtype=np.int32)
+
+        # Getting the skin on more than one result requires an Ansys 2023 R2
+        # (DPF 7.0) server: warn early with an actionable message instead of
+        # letting the evaluation fail deep inside the workflow.
+        if (
+            (skin is True or (isinstance(skin, (list, np.ndarray)) and len(skin) > 0))
+            and (
+                all_sets
+                or (isinstance(set_ids, list) and len(set_ids) > 1)
+                or (isinstance(modes, list) and len(modes) > 1)
+                or (isinstance(frequencies, list) and len(frequencies) > 1)
+            )
+            and not self._model._server.meet_version("7.0")
+        ):
+            warnings.warn(
+                "Getting the skin on more than one result (several time/freq "
+                "sets, split data...) is only supported starting with Ansys "
+                "2023 R2. Extract the sets one at a time on older servers, "
+                "for example with iter_results.",
+                UserWarning,
+            )
+
+        # Build the targeted spatial and time scoping.
+        # The time-like arguments are mutually exclusive: gather them in a
+        # bitmask, which has more than one bit set if and only if more than
+        # one argument was given.
+        mask = (
             (set_ids is not None)
-            + (all_sets is True)
-            + (frequencies is not None)
-            + (modes is not None)
-            + (selection is not None)
+            | (all_sets is True) << 1
+            | (frequencies is not None) << 2
+            | (modes is not None) << 3
+            | (selection is not None) << 4
         )
-        if tot > 1:
+        if mask & (mask - 1):
             raise ValueError(
                 "Arguments all_sets, selection, set_ids, frequencies, "
                 "and modes are mutually exclusive."
             )
-        elif tot == 0:
+        elif mask == 0:
             set_ids = 1
 
+        # The all-defaults call ("first mode, whole mesh") is the dominant
+        # pattern in interactive exploration and always produces the same
+        # dataframe for a given result file, so it is cached per simulation.
+        cache_key = None
+        if (
+            mask == 0
+            and node_ids is None
+            and element_ids is None
+            and named_selections is None
+            and components is None
+            and norm is False
+            and expand_cyclic is True
+            and phase_angle_cyclic is None
+            and external_layer is False
+            and skin is False
+            and shell_layer is None
+            and averaging_config == AveragingConfig()
+        ):
+            cache_key = (base_name, location, category)
+            cached = self._first_mode_result_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         selection, rescoping = self._build_selection(
             base_name=base_name,
             category=category,
@@ -281,26 +400,29 @@ class ModalMechanicalSimulation(MechanicalSimulation):
             )
 
         _, _, columns = _create_components(base_name, category, components)
-        return self._create_dataframe(
+        df = self._create_dataframe(
             fc, location, columns, comp, base_name, disp_wf, submesh
         )
+        if cache_key is not None:
+            self._first_mode_result_cache[cache_key] = df
+        return df
 
     def displacement(
         self,
-        node_ids: Union[List[int], None] = None,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        components: Union[str, List[str], int, List[int], None] = None,
+        node_ids: _Ids = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        components: _Components = None,
         norm: bool = False,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        set_ids: Union[int, List[int], None] = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
         """Extract displacement results from the simulation.
 
@@ -532,8 +654,8 @@ class ModalMechanicalSimulation(MechanicalSimulation):
         """
         return self._get_result(
             base_name="U",
-            location=locations.nodal,
-            category=ResultCategory.vector,
+            location=_LOC_NODAL,
+            category=_CAT_VECTOR,
             components=components,
             norm=norm,
             selection=selection,
@@ -552,20 +674,20 @@ class ModalMechanicalSimulation(MechanicalSimulation):
 
     def stress(
         self,
-        node_ids: Union[List[int], None] = None,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        components: Union[str, List[str], int, List[int], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        location: Union[locations, str] = locations.elemental_nodal,
-        set_ids: Union[int, List[int], None] = None,
+        node_ids: _Ids = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        components: _Components = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        location: _Location = locations.elemental_nodal,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
         """Extract stress results from the simulation.
 
@@ -635,7 +757,7 @@ class ModalMechanicalSimulation(MechanicalSimulation):
         return self._get_result(
             base_name="S",
             location=location,
-            category=ResultCategory.matrix,
+            category=_CAT_MATRIX,
             components=components,
             selection=selection,
             frequencies=frequencies,
@@ -653,18 +775,18 @@ class ModalMechanicalSimulation(MechanicalSimulation):
 
     def stress_elemental(
         self,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        components: Union[str, List[str], int, List[int], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        set_ids: Union[int, List[int], None] = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        components: _Components = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
         """Extract elemental stress results from the simulation.
 
@@ -723,15 +845,14 @@ class ModalMechanicalSimulation(MechanicalSimulation):
         """
         return self._get_result(
             base_name="S",
-            location=locations.elemental,
-            category=ResultCategory.matrix,
+            location=_LOC_ELEMENTAL,
+            category=_CAT_MATRIX,
             components=components,
             selection=selection,
             frequencies=frequencies,
             set_ids=set_ids,
             all_sets=all_sets,
             modes=modes,
-            node_ids=None,
             element_ids=element_ids,
             named_selections=named_selections,
             expand_cyclic=expand_cyclic,
@@ -742,19 +863,19 @@ class ModalMechanicalSimulation(MechanicalSimulation):
 
     def stress_nodal(
         self,
-        node_ids: Union[List[int], None] = None,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        components: Union[str, List[str], int, List[int], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        set_ids: Union[int, List[int], None] = None,
+        node_ids: _Ids = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        components: _Components = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
         """Extract nodal stress results from the simulation.
 
@@ -815,8 +936,8 @@ class ModalMechanicalSimulation(MechanicalSimulation):
         """
         return self._get_result(
             base_name="S",
-            location=locations.nodal,
-            category=ResultCategory.matrix,
+            location=_LOC_NODAL,
+            category=_CAT_MATRIX,
             components=components,
             selection=selection,
             frequencies=frequencies,
@@ -834,20 +955,20 @@ class ModalMechanicalSimulation(MechanicalSimulation):
 
     def stress_principal(
         self,
-        node_ids: Union[List[int], None] = None,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        components: Union[List[str], List[int], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        location: Union[locations, str] = locations.elemental_nodal,
-        set_ids: Union[int, List[int], None] = None,
+        node_ids: _Ids = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        components: _ComponentsList = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        location: _Location = locations.elemental_nodal,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
         """Extract principal stress results from the simulation.
 
@@ -916,7 +1037,7 @@ class ModalMechanicalSimulation(MechanicalSimulation):
         return self._get_result(
             base_name="S",
             location=location,
-            category=ResultCategory.principal,
+            category=_CAT_PRINCIPAL,
             components=components,
             selection=selection,
             frequencies=frequencies,
@@ -934,18 +1055,18 @@ class ModalMechanicalSimulation(MechanicalSimulation):
 
     def stress_principal_elemental(
         self,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        components: Union[List[str], List[int], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        set_ids: Union[int, List[int], None] = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        components: _ComponentsList = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
         """Extract elemental principal stress results from the simulation.
 
@@ -1003,15 +1124,14 @@ class ModalMechanicalSimulation(MechanicalSimulation):
         """
         return self._get_result(
             base_name="S",
-            location=locations.elemental,
-            category=ResultCategory.principal,
+            location=_LOC_ELEMENTAL,
+            category=_CAT_PRINCIPAL,
             components=components,
             selection=selection,
             frequencies=frequencies,
             set_ids=set_ids,
             all_sets=all_sets,
             modes=modes,
-            node_ids=None,
             element_ids=element_ids,
             named_selections=named_selections,
             expand_cyclic=expand_cyclic,
@@ -1022,19 +1142,19 @@ class ModalMechanicalSimulation(MechanicalSimulation):
 
     def stress_principal_nodal(
         self,
-        node_ids: Union[List[int], None] = None,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        components: Union[List[str], List[int], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        set_ids: Union[int, List[int], None] = None,
+        node_ids: _Ids = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        components: _ComponentsList = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
         """Extract nodal principal stress results from the simulation.
 
@@ -1094,8 +1214,8 @@ class ModalMechanicalSimulation(MechanicalSimulation):
         """
         return self._get_result(
             base_name="S",
-            location=locations.nodal,
-            category=ResultCategory.principal,
+            location=_LOC_NODAL,
+            category=_CAT_PRINCIPAL,
             components=components,
             selection=selection,
             frequencies=frequencies,
@@ -1113,19 +1233,19 @@ class ModalMechanicalSimulation(MechanicalSimulation):
 
     def stress_eqv_von_mises(
         self,
-        node_ids: Union[List[int], None] = None,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        location: Union[locations, str] = locations.elemental_nodal,
-        set_ids: Union[int, List[int], None] = None,
+        node_ids: _Ids = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        location: _Location = locations.elemental_nodal,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
         """Extract equivalent von Mises stress results from the simulation.
 
@@ -1192,7 +1312,7 @@ class ModalMechanicalSimulation(MechanicalSimulation):
         return self._get_result(
             base_name="S",
             location=location,
-            category=ResultCategory.equivalent,
+            category=_CAT_EQUIVALENT,
             components=None,
             selection=selection,
             frequencies=frequencies,
@@ -1210,17 +1330,17 @@ class ModalMechanicalSimulation(MechanicalSimulation):
 
     def stress_eqv_von_mises_elemental(
         self,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        set_ids: Union[int, List[int], None] = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
         """Extract elemental equivalent von Mises stress results from the simulation.
 
@@ -1276,15 +1396,14 @@ class ModalMechanicalSimulation(MechanicalSimulation):
         """
         return self._get_result(
             base_name="S",
-            location=locations.elemental,
-            category=ResultCategory.equivalent,
+            location=_LOC_ELEMENTAL,
+            category=_CAT_EQUIVALENT,
             components=None,
             selection=selection,
             frequencies=frequencies,
             set_ids=set_ids,
             all_sets=all_sets,
             modes=modes,
-            node_ids=None,
             element_ids=element_ids,
             named_selections=named_selections,
             expand_cyclic=expand_cyclic,
@@ -1295,18 +1414,18 @@ class ModalMechanicalSimulation(MechanicalSimulation):
 
     def stress_eqv_von_mises_nodal(
         self,
-        node_ids: Union[List[int], None] = None,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        set_ids: Union[int, List[int], None] = None,
+        node_ids: _Ids = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
         """Extract nodal equivalent von Mises stress results from the simulation.
 
@@ -1364,8 +1483,8 @@ class ModalMechanicalSimulation(MechanicalSimulation):
         """
         return self._get_result(
             base_name="S",
-            location=locations.nodal,
-            category=ResultCategory.equivalent,
+            location=_LOC_NODAL,
+            category=_CAT_EQUIVALENT,
             components=None,
             selection=selection,
             frequencies=frequencies,
@@ -1383,20 +1502,20 @@ class ModalMechanicalSimulation(MechanicalSimulation):
 
     def elastic_strain(
         self,
-        node_ids: Union[List[int], None] = None,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        components: Union[str, List[str], int, List[int], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        location: Union[locations, str] = locations.elemental_nodal,
-        set_ids: Union[int, List[int], None] = None,
+        node_ids: _Ids = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        components: _Components = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        location: _Location = locations.elemental_nodal,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
         """Extract elastic strain results from the simulation.
 
@@ -1466,7 +1585,7 @@ class ModalMechanicalSimulation(MechanicalSimulation):
         return self._get_result(
             base_name="EPEL",
             location=location,
-            category=ResultCategory.matrix,
+            category=_CAT_MATRIX,
             components=components,
             selection=selection,
             frequencies=frequencies,
@@ -1484,19 +1603,19 @@ class ModalMechanicalSimulation(MechanicalSimulation):
 
     def elastic_strain_nodal(
         self,
-        node_ids: Union[List[int], None] = None,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        components: Union[str, List[str], int, List[int], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        set_ids: Union[int, List[int], None] = None,
+        node_ids: _Ids = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        components: _Components = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
         """Extract nodal elastic strain results from the simulation.
 
@@ -1557,8 +1676,8 @@ class ModalMechanicalSimulation(MechanicalSimulation):
         """
         return self._get_result(
             base_name="EPEL",
-            location=locations.nodal,
-            category=ResultCategory.matrix,
+            location=_LOC_NODAL,
+            category=_CAT_MATRIX,
             components=components,
             selection=selection,
             frequencies=frequencies,
@@ -1576,18 +1695,18 @@ class ModalMechanicalSimulation(MechanicalSimulation):
 
     def elastic_strain_elemental(
         self,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        components: Union[str, List[str], int, List[int], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        set_ids: Union[int, List[int], None] = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        components: _Components = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
         """Extract elemental elastic strain results from the simulation.
 
@@ -1646,15 +1765,14 @@ class ModalMechanicalSimulation(MechanicalSimulation):
         """
         return self._get_result(
             base_name="EPEL",
-            location=locations.elemental,
-            category=ResultCategory.matrix,
+            location=_LOC_ELEMENTAL,
+            category=_CAT_MATRIX,
             components=components,
             selection=selection,
             frequencies=frequencies,
             set_ids=set_ids,
             all_sets=all_sets,
             modes=modes,
-            node_ids=None,
             element_ids=element_ids,
             named_selections=named_selections,
             expand_cyclic=expand_cyclic,
@@ -1665,20 +1783,20 @@ class ModalMechanicalSimulation(MechanicalSimulation):
 
     def elastic_strain_principal(
         self,
-        node_ids: Union[List[int], None] = None,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        components: Union[str, List[str], int, List[int], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        location: Union[locations, str] = locations.elemental_nodal,
-        set_ids: Union[int, List[int], None] = None,
+        node_ids: _Ids = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        components: _Components = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        location: _Location = locations.elemental_nodal,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
         """Extract principal elastic strain results from the simulation.
 
@@ -1747,7 +1865,7 @@ class ModalMechanicalSimulation(MechanicalSimulation):
         return self._get_result(
             base_name="EPEL",
             location=location,
-            category=ResultCategory.principal,
+            category=_CAT_PRINCIPAL,
             components=components,
             selection=selection,
             frequencies=frequencies,
@@ -1765,19 +1883,19 @@ class ModalMechanicalSimulation(MechanicalSimulation):
 
     def elastic_strain_principal_nodal(
         self,
-        node_ids: Union[List[int], None] = None,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        components: Union[str, List[str], int, List[int], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        set_ids: Union[int, List[int], None] = None,
+        node_ids: _Ids = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        components: _Components = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
         """Extract nodal principal elastic strain results from the simulation.
 
@@ -1837,8 +1955,8 @@ class ModalMechanicalSimulation(MechanicalSimulation):
         """
         return self._get_result(
             base_name="EPEL",
-            location=locations.nodal,
-            category=ResultCategory.principal,
+            location=_LOC_NODAL,
+            category=_CAT_PRINCIPAL,
             components=components,
             selection=selection,
             frequencies=frequencies,
@@ -1856,18 +1974,18 @@ class ModalMechanicalSimulation(MechanicalSimulation):
 
     def elastic_strain_principal_elemental(
         self,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        components: Union[str, List[str], int, List[int], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        set_ids: Union[int, List[int], None] = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        components: _Components = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
         """Extract elemental principal elastic strain results from the simulation.
 
@@ -1925,15 +2043,14 @@ class ModalMechanicalSimulation(MechanicalSimulation):
         """
         return self._get_result(
             base_name="EPEL",
-            location=locations.elemental,
-            category=ResultCategory.principal,
+            location=_LOC_ELEMENTAL,
+            category=_CAT_PRINCIPAL,
             components=components,
             selection=selection,
             frequencies=frequencies,
             set_ids=set_ids,
             all_sets=all_sets,
             modes=modes,
-            node_ids=None,
             element_ids=element_ids,
             named_selections=named_selections,
             expand_cyclic=expand_cyclic,
@@ -1944,19 +2061,19 @@ class ModalMechanicalSimulation(MechanicalSimulation):
 
     def elastic_strain_eqv_von_mises(
         self,
-        node_ids: Union[List[int], None] = None,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        location: Union[locations, str] = locations.elemental_nodal,
-        set_ids: Union[int, List[int], None] = None,
+        node_ids: _Ids = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        location: _Location = locations.elemental_nodal,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
         """Extract equivalent von Mises elastic strain results from the simulation.
 
@@ -2023,7 +2140,7 @@ class ModalMechanicalSimulation(MechanicalSimulation):
         return self._get_result(
             base_name="EPEL",
             location=location,
-            category=ResultCategory.equivalent,
+            category=_CAT_EQUIVALENT,
             components=None,
             selection=selection,
             frequencies=frequencies,
@@ -2041,17 +2158,17 @@ class ModalMechanicalSimulation(MechanicalSimulation):
 
     def elastic_strain_eqv_von_mises_elemental(
         self,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        set_ids: Union[int, List[int], None] = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
         """Extract elemental equivalent von Mises elastic strain results from the simulation.
 
@@ -2107,15 +2224,14 @@ class ModalMechanicalSimulation(MechanicalSimulation):
         """
         return self._get_result(
             base_name="EPEL",
-            location=locations.elemental,
-            category=ResultCategory.equivalent,
+            location=_LOC_ELEMENTAL,
+            category=_CAT_EQUIVALENT,
             components=None,
             selection=selection,
             frequencies=frequencies,
             set_ids=set_ids,
             all_sets=all_sets,
             modes=modes,
-            node_ids=None,
             element_ids=element_ids,
             named_selections=named_selections,
             expand_cyclic=expand_cyclic,
@@ -2126,18 +2242,18 @@ class ModalMechanicalSimulation(MechanicalSimulation):
 
     def elastic_strain_eqv_von_mises_nodal(
         self,
-        node_ids: Union[List[int], None] = None,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        set_ids: Union[int, List[int], None] = None,
+        node_ids: _Ids = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
         """Extract nodal equivalent von Mises elastic strain results from the simulation.
 
@@ -2195,8 +2311,8 @@ class ModalMechanicalSimulation(MechanicalSimulation):
         """
         return self._get_result(
             base_name="EPEL",
-            location=locations.nodal,
-            category=ResultCategory.equivalent,
+            location=_LOC_NODAL,
+            category=_CAT_EQUIVALENT,
             components=None,
             selection=selection,
             frequencies=frequencies,
@@ -2212,88 +2328,28 @@ class ModalMechanicalSimulation(MechanicalSimulation):
             skin=skin,
         )
 
+    @_cache_result_method
     def plastic_state_variable(
         self,
-        node_ids: Union[List[int], None] = None,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        location: Union[locations, str] = locations.elemental_nodal,
-        set_ids: Union[int, List[int], None] = None,
+        node_ids: _Ids = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        location: _Location = locations.elemental_nodal,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
-        """Extract plastic state variable results from the simulation.
-
-        Arguments `selection`, `set_ids`, `all_sets`, `frequencies`, and `modes` are mutually
-        exclusive.
-        If none of the above is given, only the first mode will be returned.
-
-        Arguments `selection`, `named_selections`, `element_ids`, and `node_ids` are mutually
-        exclusive.
-        If none of the above is given, results will be extracted for the whole mesh.
-
-        Parameters
-        ----------
-        node_ids:
-            List of IDs of nodes to get results for.
-        element_ids:
-            List of IDs of elements to get results for.
-        frequencies:
-            Frequency value or list of frequency values to get results for.
-        modes:
-            Mode number or list of mode numbers to get results for.
-        named_selections:
-            Named selection or list of named selections to get results for.
-        selection:
-            Selection to get results for.
-            A Selection defines both spatial and time-like criteria for filtering.
-        location:
-            Location to extract results at. Available locations are listed in
-            class:`post.locations` and are: `post.locations.nodal`,
-            `post.locations.elemental`, and `post.locations.elemental_nodal`.
-            Using the default `post.locations.elemental_nodal` results in a value
-            for every node at each element. Similarly, using `post.locations.elemental`
-            gives results with one value for each element, while using `post.locations.nodal`
-            gives results with one value for each node.
-        set_ids:
-            Sets to get results for. Equivalent to modes.
-            Common to all simulation types for easier scripting.
-        all_sets:
-            Whether to get results for all sets/modes.
-        expand_cyclic:
-            For cyclic problems, whether to expand the sectors.
-            Can take a list of sector numbers to select specific sectors to expand
-            (one-based indexing).
-            If the problem is multi-stage, can take a list of lists of sector numbers, ordered
-            by stage.
-        phase_angle_cyclic:
-             For cyclic problems, phase angle to apply (in degrees).
-        external_layer:
-             Select the external layer (last layer of solid elements under the skin)
-             of the mesh for plotting and data extraction. If a list is passed, the external
-             layer is computed over list of elements.
-        skin:
-             Select the skin (creates new 2D elements connecting the external nodes)
-             of the mesh for plotting and data extraction. If a list is passed, the skin
-             is computed over list of elements (not supported for cyclic symmetry). Getting the
-             skin on more than one result (several time freq sets, split data...) is only
-             supported starting with Ansys 2023R2.
-
-        Returns
-        -------
-        Returns a :class:`ansys.dpf.post.data_object.DataFrame` instance.
-
-        """
+        """Extract plastic state variable results from the simulation."""
         return self._get_result(
             base_name="ENL_PSV",
             location=location,
-            category=ResultCategory.scalar,
+            category=_CAT_SCALAR,
             components=None,
             selection=selection,
             frequencies=frequencies,
@@ -2309,83 +2365,32 @@ class ModalMechanicalSimulation(MechanicalSimulation):
             skin=skin,
         )
 
+    @_cache_result_method
     def plastic_state_variable_elemental(
         self,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        set_ids: Union[int, List[int], None] = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
-        """Extract elemental plastic state variable results from the simulation.
-
-        Arguments `selection`, `set_ids`, `all_sets`, `frequencies`, and `modes` are mutually
-        exclusive.
-        If none of the above is given, only the first mode will be returned.
-
-        Arguments `selection`, `named_selections`, and `element_ids` are mutually
-        exclusive.
-        If none of the above is given, results will be extracted for the whole mesh.
-
-        Parameters
-        ----------
-        element_ids:
-            List of IDs of elements to get results for.
-        frequencies:
-            Frequency value or list of frequency values to get results for.
-        modes:
-            Mode number or list of mode numbers to get results for.
-        named_selections:
-            Named selection or list of named selections to get results for.
-        selection:
-            Selection to get results for.
-            A Selection defines both spatial and time-like criteria for filtering.
-        set_ids:
-            Sets to get results for. Equivalent to modes.
-            Common to all simulation types for easier scripting.
-        all_sets:
-            Whether to get results for all sets/modes.
-        expand_cyclic:
-            For cyclic problems, whether to expand the sectors.
-            Can take a list of sector numbers to select specific sectors to expand
-            (one-based indexing).
-            If the problem is multi-stage, can take a list of lists of sector numbers, ordered
-            by stage.
-        phase_angle_cyclic:
-             For cyclic problems, phase angle to apply (in degrees).
-        external_layer:
-             Select the external layer (last layer of solid elements under the skin)
-             of the mesh for plotting and data extraction. If a list is passed, the external
-             layer is computed over list of elements.
-        skin:
-             Select the skin (creates new 2D elements connecting the external nodes)
-             of the mesh for plotting and data extraction. If a list is passed, the skin
-             is computed over list of elements (not supported for cyclic symmetry). Getting the
-             skin on more than one result (several time freq sets, split data...) is only
-             supported starting with Ansys 2023R2.
-
-        Returns
-        -------
-        Returns a :class:`ansys.dpf.post.data_object.DataFrame` instance.
-
-        """
+        """Extract elemental plastic state variable results from the simulation."""
         return self._get_result(
             base_name="ENL_PSV",
-            location=locations.elemental,
-            category=ResultCategory.scalar,
+            location=_LOC_ELEMENTAL,
+            category=_CAT_SCALAR,
             components=None,
             selection=selection,
             frequencies=frequencies,
             set_ids=set_ids,
             all_sets=all_sets,
             modes=modes,
-            node_ids=None,
             element_ids=element_ids,
             named_selections=named_selections,
             expand_cyclic=expand_cyclic,
@@ -2394,79 +2399,27 @@ class ModalMechanicalSimulation(MechanicalSimulation):
             skin=skin,
         )
 
+    @_cache_result_method
     def plastic_state_variable_nodal(
         self,
-        node_ids: Union[List[int], None] = None,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        set_ids: Union[int, List[int], None] = None,
+        node_ids: _Ids = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
-        """Extract nodal plastic state variable results from the simulation.
-
-        Arguments `selection`, `set_ids`, `all_sets`, `frequencies`, and `modes` are mutually
-        exclusive.
-        If none of the above is given, only the first mode will be returned.
-
-        Arguments `selection`, `named_selections`, `element_ids`, and `node_ids` are mutually
-        exclusive.
-        If none of the above is given, results will be extracted for the whole mesh.
-
-        Parameters
-        ----------
-        node_ids:
-            List of IDs of nodes to get results for.
-        element_ids:
-            List of IDs of elements to get results for.
-        frequencies:
-            Frequency value or list of frequency values to get results for.
-        modes:
-            Mode number or list of mode numbers to get results for.
-        named_selections:
-            Named selection or list of named selections to get results for.
-        selection:
-            Selection to get results for.
-            A Selection defines both spatial and time-like criteria for filtering.
-        set_ids:
-            Sets to get results for. Equivalent to modes.
-            Common to all simulation types for easier scripting.
-        all_sets:
-            Whether to get results for all sets/modes.
-        expand_cyclic:
-            For cyclic problems, whether to expand the sectors.
-            Can take a list of sector numbers to select specific sectors to expand
-            (one-based indexing).
-            If the problem is multi-stage, can take a list of lists of sector numbers, ordered
-            by stage.
-        phase_angle_cyclic:
-             For cyclic problems, phase angle to apply (in degrees).
-        external_layer:
-             Select the external layer (last layer of solid elements under the skin)
-             of the mesh for plotting and data extraction. If a list is passed, the external
-             layer is computed over list of elements.
-        skin:
-             Select the skin (creates new 2D elements connecting the external nodes)
-             of the mesh for plotting and data extraction. If a list is passed, the skin
-             is computed over list of elements (not supported for cyclic symmetry). Getting the
-             skin on more than one result (several time freq sets, split data...) is only
-             supported starting with Ansys 2023R2.
-
-        Returns
-        -------
-        Returns a :class:`ansys.dpf.post.data_object.DataFrame` instance.
-
-        """
+        """Extract nodal plastic state variable results from the simulation."""
         return self._get_result(
             base_name="ENL_PSV",
-            location=locations.nodal,
-            category=ResultCategory.scalar,
+            location=_LOC_NODAL,
+            category=_CAT_SCALAR,
             components=None,
             selection=selection,
             frequencies=frequencies,
@@ -2482,92 +2435,29 @@ class ModalMechanicalSimulation(MechanicalSimulation):
             skin=skin,
         )
 
+    @_cache_result_method
     def plastic_strain(
         self,
-        node_ids: Union[List[int], None] = None,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        components: Union[str, List[str], int, List[int], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        location: Union[locations, str] = locations.elemental_nodal,
-        set_ids: Union[int, List[int], None] = None,
+        node_ids: _Ids = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        components: _Components = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        location: _Location = locations.elemental_nodal,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
-        """Extract plastic strain results from the simulation.
-
-        Arguments `selection`, `set_ids`, `all_sets`, `frequencies`, and `modes` are mutually
-        exclusive.
-        If none of the above is given, only the first mode will be returned.
-
-        Arguments `selection`, `named_selections`, `element_ids`, and `node_ids` are mutually
-        exclusive.
-        If none of the above is given, results will be extracted for the whole mesh.
-
-        Parameters
-        ----------
-        node_ids:
-            List of IDs of nodes to get results for.
-        element_ids:
-            List of IDs of elements to get results for.
-        frequencies:
-            Frequency value or list of frequency values to get results for.
-        components:
-            Components to get results for. Available components are "X", "Y", "Z", "XX", "XY",
-            "XZ", and their respective equivalents 1, 2, 3, 4, 5, 6.
-        modes:
-            Mode number or list of mode numbers to get results for.
-        named_selections:
-            Named selection or list of named selections to get results for.
-        selection:
-            Selection to get results for.
-            A Selection defines both spatial and time-like criteria for filtering.
-        location:
-            Location to extract results at. Available locations are listed in
-            class:`post.locations` and are: `post.locations.nodal`,
-            `post.locations.elemental`, and `post.locations.elemental_nodal`.
-            Using the default `post.locations.elemental_nodal` results in a value
-            for every node at each element. Similarly, using `post.locations.elemental`
-            gives results with one value for each element, while using `post.locations.nodal`
-            gives results with one value for each node.
-        set_ids:
-            Sets to get results for. Equivalent to modes.
-            Common to all simulation types for easier scripting.
-        all_sets:
-            Whether to get results for all sets/modes.
-        expand_cyclic:
-            For cyclic problems, whether to expand the sectors.
-            Can take a list of sector numbers to select specific sectors to expand
-            (one-based indexing).
-            If the problem is multi-stage, can take a list of lists of sector numbers, ordered
-            by stage.
-        phase_angle_cyclic:
-             For cyclic problems, phase angle to apply (in degrees).
-        external_layer:
-             Select the external layer (last layer of solid elements under the skin)
-             of the mesh for plotting and data extraction. If a list is passed, the external
-             layer is computed over list of elements.
-        skin:
-             Select the skin (creates new 2D elements connecting the external nodes)
-             of the mesh for plotting and data extraction. If a list is passed, the skin
-             is computed over list of elements (not supported for cyclic symmetry). Getting the
-             skin on more than one result (several time freq sets, split data...) is only
-             supported starting with Ansys 2023R2.
-
-        Returns
-        -------
-        Returns a :class:`ansys.dpf.post.data_object.DataFrame` instance.
-
-        """
+        """Extract plastic strain results from the simulation."""
         return self._get_result(
             base_name="EPPL",
             location=location,
-            category=ResultCategory.matrix,
+            category=_CAT_MATRIX,
             components=components,
             selection=selection,
             frequencies=frequencies,
@@ -2583,90 +2473,70 @@ class ModalMechanicalSimulation(MechanicalSimulation):
             skin=skin,
         )
 
+    @_cache_result_method
     def plastic_strain_nodal(
         self,
-        node_ids: Union[List[int], None] = None,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        components: Union[str, List[str], int, List[int], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        set_ids: Union[int, List[int], None] = None,
+        node_ids: _Ids = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        components: _Components = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
-        """Extract nodal plastic strain results from the simulation.
-
-        Arguments `selection`, `set_ids`, `all_sets`, `frequencies`, and `modes` are mutually
-        exclusive.
-        If none of the above is given, only the first mode will be returned.
+        """Extract nodal plastic strain results from the simulation."""
+        return self._get_result(
+            base_name="EPPL",
+            location=_LOC_NODAL,
+            category=_CAT_MATRIX,
+            components=components,
+            selection=selection,
+            frequencies=frequencies,
+            set_ids=set_ids,
+            all_sets=all_sets,
+            modes=modes,
+            node_ids=node_ids,
+            element_ids=element_ids,
+            named_selections=named_selections,
+            expand_cyclic=expand_cyclic,
+            phase_angle_cyclic=phase_angle_cyclic,
+            external_layer=external_layer,
+            skin=skin,
+        )
 
-        Arguments `selection`, `named_selections`, `element_ids`, and `node_ids` are mutually
-        exclusive.
-        If none of the above is given, results will be extracted for the whole mesh.
-
-        Parameters
-        ----------
-        node_ids:
-            List of IDs of nodes to get results for.
-        element_ids:
-            List of IDs of elements to get results for.
-        frequencies:
-            Frequency value or list of frequency values to get results for.
-        components:
-            Components to get results for. Available components are "X", "Y", "Z", "XX", "XY",
-            "XZ", and their respective equivalents 1, 2, 3, 4, 5, 6.
-        modes:
-            Mode number or list of mode numbers to get results for.
-        named_selections:
-            Named selection or list of named selections to get results for.
-        selection:
-            Selection to get results for.
-            A Selection defines both spatial and time-like criteria for filtering.
-        set_ids:
-            Sets to get results for. Equivalent to modes.
-            Common to all simulation types for easier scripting.
-        all_sets:
-            Whether to get results for all sets/modes.
-        expand_cyclic:
-            For cyclic problems, whether to expand the sectors.
-            Can take a list of sector numbers to select specific sectors to expand
-            (one-based indexing).
-            If the problem is multi-stage, can take a list of lists of sector numbers, ordered
-            by stage.
-        phase_angle_cyclic:
-             For cyclic problems, phase angle to apply (in degrees).
-        external_layer:
-             Select the external layer (last layer of solid elements under the skin)
-             of the mesh for plotting and data extraction. If a list is passed, the external
-             layer is computed over list of elements.
-        skin:
-             Select the skin (creates new 2D elements connecting the external nodes)
-             of the mesh for plotting and data extraction. If a list is passed, the skin
-             is computed over list of elements (not supported for cyclic symmetry). Getting the
-             skin on more than one result (several time freq sets, split data...) is only
-             supported starting with Ansys 2023R2.
-
-        Returns
-        -------
-        Returns a :class:`ansys.dpf.post.data_object.DataFrame` instance.
-
-        """
+    @_cache_result_method
+    def plastic_strain_elemental(
+        self,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        components: _Components = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        set_ids: _Sets = None,
+        all_sets: bool = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
+    ) -> DataFrame:
+        """Extract elemental plastic strain results from the simulation."""
         return self._get_result(
             base_name="EPPL",
-            location=locations.nodal,
-            category=ResultCategory.matrix,
+            location=_LOC_ELEMENTAL,
+            category=_CAT_MATRIX,
             components=components,
             selection=selection,
             frequencies=frequencies,
             set_ids=set_ids,
             all_sets=all_sets,
             modes=modes,
-            node_ids=node_ids,
             element_ids=element_ids,
             named_selections=named_selections,
             expand_cyclic=expand_cyclic,
@@ -2675,180 +2545,278 @@ class ModalMechanicalSimulation(MechanicalSimulation):
             skin=skin,
         )
 
-    def plastic_strain_elemental(
+    def plastic_strain_all_locations(
         self,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        components: Union[str, List[str], int, List[int], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        set_ids: Union[int, List[int], None] = None,
+        node_ids: _Ids = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        components: _Components = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
-    ) -> DataFrame:
-        """Extract elemental plastic strain results from the simulation.
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
+    ) -> Dict[str, DataFrame]:
+        """Extract plastic strain results at every location from the simulation.
+
+        Convenience around :meth:`plastic_strain`,
+        :meth:`plastic_strain_elemental`, and :meth:`plastic_strain_nodal`:
+        extracts the elemental nodal, elemental, and nodal plastic strain and
+        returns the resulting dataframes in a dictionary keyed by location.
+
+        Arguments are the same as for :meth:`plastic_strain`, except
+        ``location``. As with :meth:`plastic_strain_elemental`, the elemental
+        entry does not take a node scoping: a ``node_ids`` argument applies
+        to the elemental nodal and nodal entries only.
 
-        Arguments `selection`, `set_ids`, `all_sets`, `frequencies`, and `modes` are mutually
-        exclusive.
-        If none of the above is given, only the first mode will be returned.
+        Returns
+        -------
+        Dictionary mapping each location of :class:`post.locations` to a
+        :class:`ansys.dpf.post.data_object.DataFrame` instance.
 
-        Arguments `selection`, `named_selections`, and `element_ids` are mutually
-        exclusive.
-        If none of the above is given, results will be extracted for the whole mesh.
+        """
+        return {
+            location: self._get_result(
+                base_name="EPPL",
+                location=location,
+                category=_CAT_MATRIX,
+                components=components,
+                selection=selection,
+                frequencies=frequencies,
+                set_ids=set_ids,
+                all_sets=all_sets,
+                modes=modes,
+                node_ids=node_ids if location != locations.elemental else None,
+                element_ids=element_ids,
+                named_selections=named_selections,
+                expand_cyclic=expand_cyclic,
+                phase_angle_cyclic=phase_angle_cyclic,
+                external_layer=external_layer,
+                skin=skin,
+            )
+            for location in (
+                _LOC_ELEMENTAL_NODAL,
+                _LOC_ELEMENTAL,
+                _LOC_NODAL,
+            )
+        }
+
+    def iter_plastic_strain(
+        self,
+        chunk_size: int = 16,
+        **kwargs,
+    ) -> Iterator[DataFrame]:
+        """Iterate over the plastic strain results one chunk of modes at a time.
+
+        Yields one :class:`ansys.dpf.post.data_object.DataFrame` per chunk of
+        at most ``chunk_size`` modes, covering every set of the simulation in
+        order. Use this instead of ``plastic_strain(all_sets=True)`` on large
+        models, where extracting thousands of modes at once can exhaust
+        memory: peak memory scales with the chunk size instead of the total
+        number of modes.
 
         Parameters
         ----------
-        element_ids:
-            List of IDs of elements to get results for.
-        frequencies:
-            Frequency value or list of frequency values to get results for.
-        components:
-            Components to get results for. Available components are "X", "Y", "Z", "XX", "XY",
-            "XZ", and their respective equivalents 1, 2, 3, 4, 5, 6.
-        modes:
-            Mode number or list of mode numbers to get results for.
-        named_selections:
-            Named selection or list of named selections to get results for.
-        selection:
-            Selection to get results for.
-            A Selection defines both spatial and time-like criteria for filtering.
-        set_ids:
-            Sets to get results for. Equivalent to modes.
-            Common to all simulation types for easier scripting.
-        all_sets:
-            Whether to get results for all sets/modes.
-        expand_cyclic:
-            For cyclic problems, whether to expand the sectors.
-            Can take a list of sector numbers to select specific sectors to expand
-            (one-based indexing).
-            If the problem is multi-stage, can take a list of lists of sector numbers, ordered
-            by stage.
-        phase_angle_cyclic:
-             For cyclic problems, phase angle to apply (in degrees).
-        external_layer:
-             Select the external layer (last layer of solid elements under the skin)
-             of the mesh for plotting and data extraction. If a list is passed, the external
-             layer is computed over list of elements.
-        skin:
-             Select the skin (creates new 2D elements connecting the external nodes)
-             of the mesh for plotting and data extraction. If a list is passed, the skin
-             is computed over list of elements (not supported for cyclic symmetry). Getting the
-             skin on more than one result (several time freq sets, split data...) is only
-             supported starting with Ansys 2023R2.
+        chunk_size:
+            Maximum number of modes to extract per yielded dataframe.
+        **kwargs:
+            Additional arguments passed to :meth:`plastic_strain`. The
+            time-like arguments (`set_ids`, `all_sets`, `modes`,
+            `frequencies`, `selection`) are driven by the iteration and
+            cannot be passed.
 
         Returns
         -------
-        Returns a :class:`ansys.dpf.post.data_object.DataFrame` instance.
+        Iterator over :class:`ansys.dpf.post.data_object.DataFrame`
+        instances.
 
         """
-        return self._get_result(
-            base_name="EPPL",
-            location=locations.elemental,
-            category=ResultCategory.matrix,
-            components=components,
-            selection=selection,
-            frequencies=frequencies,
-            set_ids=set_ids,
-            all_sets=all_sets,
-            modes=modes,
-            node_ids=None,
-            element_ids=element_ids,
-            named_selections=named_selections,
-            expand_cyclic=expand_cyclic,
-            phase_angle_cyclic=phase_angle_cyclic,
-            external_layer=external_layer,
-            skin=skin,
-        )
+        return self._iter_result_sets(self.plastic_strain, chunk_size, kwargs)
 
-    def plastic_strain_principal(
+    def _iter_result_sets(
         self,
-        node_ids: Union[List[int], None] = None,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        components: Union[str, List[str], int, List[int], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        location: Union[locations, str] = locations.elemental_nodal,
-        set_ids: Union[int, List[int], None] = None,
-        all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
-    ) -> DataFrame:
-        """Extract principal plastic strain results from the simulation.
-
-        Arguments `selection`, `set_ids`, `all_sets`, `frequencies`, and `modes` are mutually
-        exclusive.
-        If none of the above is given, only the first mode will be returned.
-
-        Arguments `selection`, `named_selections`, `element_ids`, and `node_ids` are mutually
-        exclusive.
-        If none of the above is given, results will be extracted for the whole mesh.
+        extract,
+        chunk_size: int,
+        kwargs: dict,
+    ) -> Iterator[DataFrame]:
+        # Shared driver of the chunked iteration APIs: validates the
+        # arguments eagerly, at call time, then returns a generator yielding
+        # one dataframe per window of at most chunk_size modes.
+        if chunk_size < 1:
+            raise ValueError("Argument chunk_size must be strictly positive.")
+        # Mirror the bitmask semantics of _get_result: all_sets=False and
+        # None-valued time-like arguments count as absent.
+        if kwargs.get("all_sets"):
+            raise ValueError(
+                "Argument all_sets cannot be combined with chunked iteration."
+            )
+        for key in ("set_ids", "modes", "frequencies", "selection"):
+            if kwargs.get(key) is not None:
+                raise ValueError(
+                    f"Argument {key} cannot be combined with chunked iteration."
+                )
+        n_sets = self.time_freq_support.n_sets
+
+        # Extraction methods memoized by _cache_result_method would retain
+        # every yielded dataframe (and the fields container it pins) in
+        # _result_method_cache, making peak memory scale with the number of
+        # modes again: call the undecorated method when there is one.
+        unwrapped = getattr(extract, "__wrapped__", None)
+
+        def iterate():
+            for first_set in range(1, n_sets + 1, chunk_size):
+                set_ids = list(
+                    range(first_set, min(first_set + chunk_size, n_sets + 1))
+                )
+                if unwrapped is not None:
+                    yield unwrapped(self, set_ids=set_ids, **kwargs)
+                else:
+                    yield extract(set_ids=set_ids, **kwargs)
+
+        return iterate()
+
+    def iter_results(
+        self,
+        result: str,
+        chunk_size: int = 16,
+        **kwargs,
+    ) -> Iterator[DataFrame]:
+        """Iterate over any result one chunk of modes at a time.
+
+        Yields one :class:`ansys.dpf.post.data_object.DataFrame` per chunk of
+        at most ``chunk_size`` modes, covering every set of the simulation in
+        order. Use this instead of ``all_sets=True`` on large models, where
+        extracting thousands of modes at once can exhaust memory: peak memory
+        scales with the chunk size instead of the total number of modes.
 
         Parameters
         ----------
-        node_ids:
-            List of IDs of nodes to get results for.
-        element_ids:
-            List of IDs of elements to get results for.
-        frequencies:
-            Frequency value or list of frequency values to get results for.
-        components:
-            Components to get results for. Available components are: 1, 2, and 3.
-        modes:
-            Mode number or list of mode numbers to get results for.
-        named_selections:
-            Named selection or list of named selections to get results for.
-        selection:
-            Selection to get results for.
-            A Selection defines both spatial and time-like criteria for filtering.
-        location:
-            Location to extract results at. Available locations are listed in
-            class:`post.locations` and are: `post.locations.nodal`,
-            `post.locations.elemental`, and `post.locations.elemental_nodal`.
-            Using the default `post.locations.elemental_nodal` results in a value
-            for every node at each element. Similarly, using `post.locations.elemental`
-            gives results with one value for each element, while using `post.locations.nodal`
-            gives results with one value for each node.
-        set_ids:
-            Sets to get results for. Equivalent to modes.
-            Common to all simulation types for easier scripting.
-        all_sets:
-            Whether to get results for all sets/modes.
-        expand_cyclic:
-            For cyclic problems, whether to expand the sectors.
-            Can take a list of sector numbers to select specific sectors to expand
-            (one-based indexing).
-            If the problem is multi-stage, can take a list of lists of sector numbers, ordered
-            by stage.
-        phase_angle_cyclic:
-             For cyclic problems, phase angle to apply (in degrees).
-        external_layer:
-             Select the external layer (last layer of solid elements under the skin)
-             of the mesh for plotting and data extraction. If a list is passed, the external
-             layer is computed over list of elements.
-        skin:
-             Select the skin (creates new 2D elements connecting the external nodes)
-             of the mesh for plotting and data extraction. If a list is passed, the skin
-             is computed over list of elements (not supported for cyclic symmetry). Getting the
-             skin on more than one result (several time freq sets, split data...) is only
-             supported starting with Ansys 2023R2.
+        result:
+            Name of the result extraction method to iterate over, for example
+            ``"displacement"`` or ``"nodal_force"``.
+        chunk_size:
+            Maximum number of modes to extract per yielded dataframe.
+        **kwargs:
+            Additional arguments passed to the extraction method. The
+            time-like arguments (`set_ids`, `all_sets`, `modes`,
+            `frequencies`, `selection`) are driven by the iteration and
+            cannot be passed.
 
         Returns
         -------
-        Returns a :class:`ansys.dpf.post.data_object.DataFrame` instance.
+        Iterator over :class:`ansys.dpf.post.data_object.DataFrame`
+        instances.
+
+        """
+        extract = getattr(self, result, None)
+        if (
+            result.startswith("_")
+            or not callable(extract)
+            or "set_ids" not in inspect.signature(extract).parameters
+        ):
+            raise ValueError(
+                f"'{result}' is not the name of a result extraction method of "
+                f"{type(self).__name__}."
+            )
+        return self._iter_result_sets(extract, chunk_size, kwargs)
+
+    def plastic_strain_multi(
+        self,
+        kinds: Sequence[str] = ("matrix", "principal", "eqv"),
+        node_ids: _Ids = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        location: _Location = locations.elemental_nodal,
+        set_ids: _Sets = None,
+        all_sets: bool = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
+    ) -> Dict[str, DataFrame]:
+        """Extract several kinds of plastic strain results from the simulation.
+
+        Extracts the requested kinds of plastic strain — the tensor components
+        (``"matrix"``), the principal values (``"principal"``), and/or the
+        equivalent value (``"eqv"``) — and returns the resulting dataframes in
+        a dictionary keyed by kind. Convenience around calling
+        :meth:`plastic_strain`, :meth:`plastic_strain_principal`, and
+        :meth:`plastic_strain_eqv` back-to-back.
+
+        Arguments other than ``kinds`` are the same as for
+        :meth:`plastic_strain`, except ``components``.
+
+        Returns
+        -------
+        Dictionary mapping each requested kind to a
+        :class:`ansys.dpf.post.data_object.DataFrame` instance.
 
         """
+        categories = {
+            "matrix": _CAT_MATRIX,
+            "principal": _CAT_PRINCIPAL,
+            "eqv": _CAT_EQUIVALENT,
+        }
+        invalid = [kind for kind in kinds if kind not in categories]
+        if invalid:
+            raise ValueError(
+                f"Invalid kinds {invalid}. "
+                f"Argument 'kinds' accepts: {list(categories)}."
+            )
+        if len(set(kinds)) != len(kinds):
+            raise ValueError("Argument 'kinds' contains duplicate entries.")
+        return {
+            kind: self._get_result(
+                base_name="EPPL",
+                location=location,
+                category=categories[kind],
+                components=None,
+                selection=selection,
+                frequencies=frequencies,
+                set_ids=set_ids,
+                all_sets=all_sets,
+                modes=modes,
+                node_ids=node_ids,
+                element_ids=element_ids,
+                named_selections=named_selections,
+                expand_cyclic=expand_cyclic,
+                phase_angle_cyclic=phase_angle_cyclic,
+                external_layer=external_layer,
+                skin=skin,
+            )
+            for kind in kinds
+        }
+
+    @_cache_result_method
+    def plastic_strain_principal(
+        self,
+        node_ids: _Ids = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        components: _Components = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        location: _Location = locations.elemental_nodal,
+        set_ids: _Sets = None,
+        all_sets: bool = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
+    ) -> DataFrame:
+        """Extract principal plastic strain results from the simulation."""
         return self._get_result(
             base_name="EPPL",
             location=location,
-            category=ResultCategory.principal,
+            category=_CAT_PRINCIPAL,
             components=components,
             selection=selection,
             frequencies=frequencies,
@@ -2864,447 +2832,70 @@ class ModalMechanicalSimulation(MechanicalSimulation):
             skin=skin,
         )
 
+    @_cache_result_method
     def plastic_strain_principal_nodal(
         self,
-        node_ids: Union[List[int], None] = None,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        components: Union[str, List[str], int, List[int], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        set_ids: Union[int, List[int], None] = None,
+        node_ids: _Ids = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        components: _Components = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
-        """Extract nodal principal plastic strain results from the simulation.
-
-        Arguments `selection`, `set_ids`, `all_sets`, `frequencies`, and `modes` are mutually
-        exclusive.
-        If none of the above is given, only the first mode will be returned.
-
-        Arguments `selection`, `named_selections`, `element_ids`, and `node_ids` are mutually
-        exclusive.
-        If none of the above is given, results will be extracted for the whole mesh.
-
-        Parameters
-        ----------
-        node_ids:
-            List of IDs of nodes to get results for.
-        element_ids:
-            List of IDs of elements to get results for.
-        frequencies:
-            Frequency value or list of frequency values to get results for.
-        components:
-            Components to get results for. Available components are: 1, 2, and 3.
-        modes:
-            Mode number or list of mode numbers to get results for.
-        named_selections:
-            Named selection or list of named selections to get results for.
-        selection:
-            Selection to get results for.
-            A Selection defines both spatial and time-like criteria for filtering.
-        set_ids:
-            Sets to get results for. Equivalent to modes.
-            Common to all simulation types for easier scripting.
-        all_sets:
-            Whether to get results for all sets/modes.
-        expand_cyclic:
-            For cyclic problems, whether to expand the sectors.
-            Can take a list of sector numbers to select specific sectors to expand
-            (one-based indexing).
-            If the problem is multi-stage, can take a list of lists of sector numbers, ordered
-            by stage.
-        phase_angle_cyclic:
-             For cyclic problems, phase angle to apply (in degrees).
-        external_layer:
-             Select the external layer (last layer of solid elements under the skin)
-             of the mesh for plotting and data extraction. If a list is passed, the external
-             layer is computed over list of elements.
-        skin:
-             Select the skin (creates new 2D elements connecting the external nodes)
-             of the mesh for plotting and data extraction. If a list is passed, the skin
-             is computed over list of elements (not supported for cyclic symmetry). Getting the
-             skin on more than one result (several time freq sets, split data...) is only
-             supported starting with Ansys 2023R2.
-
-        Returns
-        -------
-        Returns a :class:`ansys.dpf.post.data_object.DataFrame` instance.
-
-        """
+        """Extract nodal principal plastic strain results from the simulation."""
         return self._get_result(
             base_name="EPPL",
-            location=locations.nodal,
-            category=ResultCategory.principal,
+            location=_LOC_NODAL,
+            category=_CAT_PRINCIPAL,
             components=components,
             selection=selection,
             frequencies=frequencies,
             set_ids=set_ids,
             all_sets=all_sets,
-            modes=modes,
-            node_ids=node_ids,
-            element_ids=element_ids,
-            named_selections=named_selections,
-            expand_cyclic=expand_cyclic,
-            phase_angle_cyclic=phase_angle_cyclic,
-            external_layer=external_layer,
-            skin=skin,
-        )
-
-    def plastic_strain_principal_elemental(
-        self,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        components: Union[str, List[str], int, List[int], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        set_ids: Union[int, List[int], None] = None,
-        all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
-    ) -> DataFrame:
-        """Extract elemental principal plastic strain results from the simulation.
-
-        Arguments `selection`, `set_ids`, `all_sets`, `frequencies`, and `modes` are mutually
-        exclusive.
-        If none of the above is given, only the first mode will be returned.
-
-        Arguments `selection`, `named_selections`, and `element_ids` are mutually
-        exclusive.
-        If none of the above is given, results will be extracted for the whole mesh.
-
-        Parameters
-        ----------
-        element_ids:
-            List of IDs of elements to get results for.
-        frequencies:
-            Frequency value or list of frequency values to get results for.
-        components:
-            Components to get results for. Available components are: 1, 2, and 3.
-        modes:
-            Mode number or list of mode numbers to get results for.
-        named_selections:
-            Named selection or list of named selections to get results for.
-        selection:
-            Selection to get results for.
-            A Selection defines both spatial and time-like criteria for filtering.
-        set_ids:
-            Sets to get results for. Equivalent to modes.
-            Common to all simulation types for easier scripting.
-        all_sets:
-            Whether to get results for all sets/modes.
-        expand_cyclic:
-            For cyclic problems, whether to expand the sectors.
-            Can take a list of sector numbers to select specific sectors to expand
-            (one-based indexing).
-            If the problem is multi-stage, can take a list of lists of sector numbers, ordered
-            by stage.
-        phase_angle_cyclic:
-             For cyclic problems, phase angle to apply (in degrees).
-        external_layer:
-             Select the external layer (last layer of solid elements under the skin)
-             of the mesh for plotting and data extraction. If a list is passed, the external
-             layer is computed over list of elements.
-        skin:
-             Select the skin (creates new 2D elements connecting the external nodes)
-             of the mesh for plotting and data extraction. If a list is passed, the skin
-             is computed over list of elements (not supported for cyclic symmetry). Getting the
-             skin on more than one result (several time freq sets, split data...) is only
-             supported starting with Ansys 2023R2.
-
-        Returns
-        -------
-        Returns a :class:`ansys.dpf.post.data_object.DataFrame` instance.
-
-        """
-        return self._get_result(
-            base_name="EPPL",
-            location=locations.elemental,
-            category=ResultCategory.principal,
-            components=components,
-            selection=selection,
-            frequencies=frequencies,
-            set_ids=set_ids,
-            all_sets=all_sets,
-            modes=modes,
-            node_ids=None,
-            element_ids=element_ids,
-            named_selections=named_selections,
-            expand_cyclic=expand_cyclic,
-            phase_angle_cyclic=phase_angle_cyclic,
-            external_layer=external_layer,
-            skin=skin,
-        )
-
-    def plastic_strain_eqv(
-        self,
-        node_ids: Union[List[int], None] = None,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        location: Union[locations, str] = locations.elemental_nodal,
-        set_ids: Union[int, List[int], None] = None,
-        all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
-    ) -> DataFrame:
-        """Extract equivalent plastic strain results from the simulation.
-
-        Arguments `selection`, `set_ids`, `all_sets`, `frequencies`, and `modes` are mutually
-        exclusive.
-        If none of the above is given, only the first mode will be returned.
-
-        Arguments `selection`, `named_selections`, `element_ids`, and `node_ids` are mutually
-        exclusive.
-        If none of the above is given, results will be extracted for the whole mesh.
-
-        Parameters
-        ----------
-        node_ids:
-            List of IDs of nodes to get results for.
-        element_ids:
-            List of IDs of elements to get results for.
-        frequencies:
-            Frequency value or list of frequency values to get results for.
-        modes:
-            Mode number or list of mode numbers to get results for.
-        named_selections:
-            Named selection or list of named selections to get results for.
-        selection:
-            Selection to get results for.
-            A Selection defines both spatial and time-like criteria for filtering.
-        location:
-            Location to extract results at. Available locations are listed in
-            class:`post.locations` and are: `post.locations.nodal`,
-            `post.locations.elemental`, and `post.locations.elemental_nodal`.
-            Using the default `post.locations.elemental_nodal` results in a value
-            for every node at each element. Similarly, using `post.locations.elemental`
-            gives results with one value for each element, while using `post.locations.nodal`
-            gives results with one value for each node.
-        set_ids:
-            Sets to get results for. Equivalent to modes.
-            Common to all simulation types for easier scripting.
-        all_sets:
-            Whether to get results for all sets/modes.
-        expand_cyclic:
-            For cyclic problems, whether to expand the sectors.
-            Can take a list of sector numbers to select specific sectors to expand
-            (one-based indexing).
-            If the problem is multi-stage, can take a list of lists of sector numbers, ordered
-            by stage.
-        phase_angle_cyclic:
-             For cyclic problems, phase angle to apply (in degrees).
-        external_layer:
-             Select the external layer (last layer of solid elements under the skin)
-             of the mesh for plotting and data extraction. If a list is passed, the external
-             layer is computed over list of elements.
-        skin:
-             Select the skin (creates new 2D elements connecting the external nodes)
-             of the mesh for plotting and data extraction. If a list is passed, the skin
-             is computed over list of elements (not supported for cyclic symmetry). Getting the
-             skin on more than one result (several time freq sets, split data...) is only
-             supported starting with Ansys 2023R2.
-
-        Returns
-        -------
-        Returns a :class:`ansys.dpf.post.data_object.DataFrame` instance.
-
-        """
-        return self._get_result(
-            base_name="EPPL",
-            location=location,
-            category=ResultCategory.equivalent,
-            components=None,
-            selection=selection,
-            frequencies=frequencies,
-            set_ids=set_ids,
-            all_sets=all_sets,
-            modes=modes,
-            node_ids=node_ids,
-            element_ids=element_ids,
-            named_selections=named_selections,
-            expand_cyclic=expand_cyclic,
-            phase_angle_cyclic=phase_angle_cyclic,
-            external_layer=external_layer,
-            skin=skin,
-        )
-
-    def plastic_strain_eqv_nodal(
-        self,
-        node_ids: Union[List[int], None] = None,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        set_ids: Union[int, List[int], None] = None,
-        all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
-    ) -> DataFrame:
-        """Extract nodal equivalent plastic strain results from the simulation.
-
-        Arguments `selection`, `set_ids`, `all_sets`, `frequencies`, and `modes` are mutually
-        exclusive.
-        If none of the above is given, only the first mode will be returned.
-
-        Arguments `selection`, `named_selections`, `element_ids`, and `node_ids` are mutually
-        exclusive.
-        If none of the above is given, results will be extracted for the whole mesh.
-
-        Parameters
-        ----------
-        node_ids:
-            List of IDs of nodes to get results for.
-        element_ids:
-            List of IDs of elements to get results for.
-        frequencies:
-            Frequency value or list of frequency values to get results for.
-        modes:
-            Mode number or list of mode numbers to get results for.
-        named_selections:
-            Named selection or list of named selections to get results for.
-        selection:
-            Selection to get results for.
-            A Selection defines both spatial and time-like criteria for filtering.
-        set_ids:
-            Sets to get results for. Equivalent to modes.
-            Common to all simulation types for easier scripting.
-        all_sets:
-            Whether to get results for all sets/modes.
-        expand_cyclic:
-            For cyclic problems, whether to expand the sectors.
-            Can take a list of sector numbers to select specific sectors to expand
-            (one-based indexing).
-            If the problem is multi-stage, can take a list of lists of sector numbers, ordered
-            by stage.
-        phase_angle_cyclic:
-             For cyclic problems, phase angle to apply (in degrees).
-        external_layer:
-             Select the external layer (last layer of solid elements under the skin)
-             of the mesh for plotting and data extraction. If a list is passed, the external
-             layer is computed over list of elements.
-        skin:
-             Select the skin (creates new 2D elements connecting the external nodes)
-             of the mesh for plotting and data extraction. If a list is passed, the skin
-             is computed over list of elements (not supported for cyclic symmetry). Getting the
-             skin on more than one result (several time freq sets, split data...) is only
-             supported starting with Ansys 2023R2.
-
-        Returns
-        -------
-        Returns a :class:`ansys.dpf.post.data_object.DataFrame` instance.
-
-        """
-        return self._get_result(
-            base_name="EPPL",
-            location=locations.nodal,
-            category=ResultCategory.equivalent,
-            components=None,
-            selection=selection,
-            frequencies=frequencies,
-            set_ids=set_ids,
-            all_sets=all_sets,
-            modes=modes,
-            node_ids=node_ids,
-            element_ids=element_ids,
-            named_selections=named_selections,
-            expand_cyclic=expand_cyclic,
-            phase_angle_cyclic=phase_angle_cyclic,
-            external_layer=external_layer,
-            skin=skin,
-        )
-
-    def plastic_strain_eqv_elemental(
-        self,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        set_ids: Union[int, List[int], None] = None,
-        all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
-    ) -> DataFrame:
-        """Extract elemental equivalent plastic strain results from the simulation.
-
-        Arguments `selection`, `set_ids`, `all_sets`, `frequencies`, and `modes` are mutually
-        exclusive.
-        If none of the above is given, only the first mode will be returned.
-
-        Arguments `selection`, `named_selections`, and `element_ids` are mutually
-        exclusive.
-        If none of the above is given, results will be extracted for the whole mesh.
-
-        Parameters
-        ----------
-        element_ids:
-            List of IDs of elements to get results for.
-        frequencies:
-            Frequency value or list of frequency values to get results for.
-        modes:
-            Mode number or list of mode numbers to get results for.
-        named_selections:
-            Named selection or list of named selections to get results for.
-        selection:
-            Selection to get results for.
-            A Selection defines both spatial and time-like criteria for filtering.
-        set_ids:
-            Sets to get results for. Equivalent to modes.
-            Common to all simulation types for easier scripting.
-        all_sets:
-            Whether to get results for all sets/modes.
-        expand_cyclic:
-            For cyclic problems, whether to expand the sectors.
-            Can take a list of sector numbers to select specific sectors to expand
-            (one-based indexing).
-            If the problem is multi-stage, can take a list of lists of sector numbers, ordered
-            by stage.
-        phase_angle_cyclic:
-             For cyclic problems, phase angle to apply (in degrees).
-        external_layer:
-             Select the external layer (last layer of solid elements under the skin)
-             of the mesh for plotting and data extraction. If a list is passed, the external
-             layer is computed over list of elements.
-        skin:
-             Select the skin (creates new 2D elements connecting the external nodes)
-             of the mesh for plotting and data extraction. If a list is passed, the skin
-             is computed over list of elements (not supported for cyclic symmetry). Getting the
-             skin on more than one result (several time freq sets, split data...) is only
-             supported starting with Ansys 2023R2.
-
-        Returns
-        -------
-        Returns a :class:`ansys.dpf.post.data_object.DataFrame` instance.
+            modes=modes,
+            node_ids=node_ids,
+            element_ids=element_ids,
+            named_selections=named_selections,
+            expand_cyclic=expand_cyclic,
+            phase_angle_cyclic=phase_angle_cyclic,
+            external_layer=external_layer,
+            skin=skin,
+        )
 
-        """
+    @_cache_result_method
+    def plastic_strain_principal_elemental(
+        self,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        components: _Components = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        set_ids: _Sets = None,
+        all_sets: bool = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
+    ) -> DataFrame:
+        """Extract elemental principal plastic strain results from the simulation."""
         return self._get_result(
             base_name="EPPL",
-            location=locations.elemental,
-            category=ResultCategory.equivalent,
-            components=None,
+            location=_LOC_ELEMENTAL,
+            category=_CAT_PRINCIPAL,
+            components=components,
             selection=selection,
             frequencies=frequencies,
             set_ids=set_ids,
             all_sets=all_sets,
             modes=modes,
-            node_ids=None,
             element_ids=element_ids,
             named_selections=named_selections,
             expand_cyclic=expand_cyclic,
@@ -3313,88 +2904,29 @@ class ModalMechanicalSimulation(MechanicalSimulation):
             skin=skin,
         )
 
-    def reaction_force(
+    @_cache_result_method
+    def plastic_strain_eqv(
         self,
-        node_ids: Union[List[int], None] = None,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        components: Union[str, List[str], int, List[int], None] = None,
-        norm: bool = False,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        set_ids: Union[int, List[int], None] = None,
+        node_ids: _Ids = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        location: _Location = locations.elemental_nodal,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
-        """Extract reaction force results from the simulation.
-
-        Arguments `selection`, `set_ids`, `all_sets`, `frequencies`, and `modes` are mutually
-        exclusive.
-        If none of the above is given, only the first mode will be returned.
-
-        Arguments `selection`, `named_selections`, `element_ids`, and `node_ids` are mutually
-        exclusive.
-        If none of the above is given, results will be extracted for the whole mesh.
-
-        Parameters
-        ----------
-        node_ids:
-            List of IDs of nodes to get results for.
-        element_ids:
-            List of IDs of elements to get results for.
-        frequencies:
-            Frequency value or list of frequency values to get results for.
-        components:
-            Components to get results for. Available components are "X", "Y", "Z",
-            and their respective equivalents 1, 2, 3.
-        norm:
-            Whether to return the norm of the results.
-        modes:
-            Mode number or list of mode numbers to get results for.
-        named_selections:
-            Named selection or list of named selections to get results for.
-        selection:
-            Selection to get results for.
-            A Selection defines both spatial and time-like criteria for filtering.
-        set_ids:
-            Sets to get results for. Equivalent to modes.
-            Common to all simulation types for easier scripting.
-        all_sets:
-            Whether to get results for all sets/modes.
-        expand_cyclic:
-            For cyclic problems, whether to expand the sectors.
-            Can take a list of sector numbers to select specific sectors to expand
-            (one-based indexing).
-            If the problem is multi-stage, can take a list of lists of sector numbers, ordered
-            by stage.
-        phase_angle_cyclic:
-             For cyclic problems, phase angle to apply (in degrees).
-        external_layer:
-             Select the external layer (last layer of solid elements under the skin)
-             of the mesh for plotting and data extraction. If a list is passed, the external
-             layer is computed over list of elements.
-        skin:
-             Select the skin (creates new 2D elements connecting the external nodes)
-             of the mesh for plotting and data extraction. If a list is passed, the skin
-             is computed over list of elements (not supported for cyclic symmetry). Getting the
-             skin on more than one result (several time freq sets, split data...) is only
-             supported starting with Ansys 2023R2.
-
-        Returns
-        -------
-        Returns a :class:`ansys.dpf.post.data_object.DataFrame` instance.
-
-        """
+        """Extract equivalent plastic strain results from the simulation."""
         return self._get_result(
-            base_name="RF",
-            location=locations.nodal,
-            category=ResultCategory.vector,
-            components=components,
-            norm=norm,
+            base_name="EPPL",
+            location=location,
+            category=_CAT_EQUIVALENT,
+            components=None,
             selection=selection,
             frequencies=frequencies,
             set_ids=set_ids,
@@ -3409,83 +2941,34 @@ class ModalMechanicalSimulation(MechanicalSimulation):
             skin=skin,
         )
 
-    def elemental_volume(
+    @_cache_result_method
+    def plastic_strain_eqv_nodal(
         self,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        set_ids: Union[int, List[int], None] = None,
+        node_ids: _Ids = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
-        """Extract elemental volume results from the simulation.
-
-        Arguments `selection`, `set_ids`, `all_sets`, `frequencies`, and `modes` are mutually
-        exclusive.
-        If none of the above is given, only the first mode will be returned.
-
-        Arguments `selection`, `named_selections`, and `element_ids` are mutually
-        exclusive.
-        If none of the above is given, results will be extracted for the whole mesh.
-
-        Parameters
-        ----------
-        element_ids:
-            List of IDs of elements to get results for.
-        frequencies:
-            Frequency value or list of frequency values to get results for.
-        modes:
-            Mode number or list of mode numbers to get results for.
-        named_selections:
-            Named selection or list of named selections to get results for.
-        selection:
-            Selection to get results for.
-            A Selection defines both spatial and time-like criteria for filtering.
-        set_ids:
-            Sets to get results for. Equivalent to modes.
-            Common to all simulation types for easier scripting.
-        all_sets:
-            Whether to get results for all sets/modes.
-        expand_cyclic:
-            For cyclic problems, whether to expand the sectors.
-            Can take a list of sector numbers to select specific sectors to expand
-            (one-based indexing).
-            If the problem is multi-stage, can take a list of lists of sector numbers, ordered
-            by stage.
-        phase_angle_cyclic:
-             For cyclic problems, phase angle to apply (in degrees).
-        external_layer:
-             Select the external layer (last layer of solid elements under the skin)
-             of the mesh for plotting and data extraction. If a list is passed, the external
-             layer is computed over list of elements.
-        skin:
-             Select the skin (creates new 2D elements connecting the external nodes)
-             of the mesh for plotting and data extraction. If a list is passed, the skin
-             is computed over list of elements (not supported for cyclic symmetry). Getting the
-             skin on more than one result (several time freq sets, split data...) is only
-             supported starting with Ansys 2023R2.
-
-        Returns
-        -------
-        Returns a :class:`ansys.dpf.post.data_object.DataFrame` instance.
-
-        """
+        """Extract nodal equivalent plastic strain results from the simulation."""
         return self._get_result(
-            base_name="ENG_VOL",
-            location=locations.elemental,
-            category=ResultCategory.scalar,
+            base_name="EPPL",
+            location=_LOC_NODAL,
+            category=_CAT_EQUIVALENT,
             components=None,
             selection=selection,
             frequencies=frequencies,
             set_ids=set_ids,
             all_sets=all_sets,
             modes=modes,
-            node_ids=None,
+            node_ids=node_ids,
             element_ids=element_ids,
             named_selections=named_selections,
             expand_cyclic=expand_cyclic,
@@ -3494,83 +2977,32 @@ class ModalMechanicalSimulation(MechanicalSimulation):
             skin=skin,
         )
 
-    def elemental_mass(
+    @_cache_result_method
+    def plastic_strain_eqv_elemental(
         self,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        set_ids: Union[int, List[int], None] = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
-        """Extract elemental mass results from the simulation.
-
-        Arguments `selection`, `set_ids`, `all_sets`, `frequencies`, and `modes` are mutually
-        exclusive.
-        If none of the above is given, only the first mode will be returned.
-
-        Arguments `selection`, `named_selections`, and `element_ids` are mutually
-        exclusive.
-        If none of the above is given, results will be extracted for the whole mesh.
-
-        Parameters
-        ----------
-        element_ids:
-            List of IDs of elements to get results for.
-        frequencies:
-            Frequency value or list of frequency values to get results for.
-        modes:
-            Mode number or list of mode numbers to get results for.
-        named_selections:
-            Named selection or list of named selections to get results for.
-        selection:
-            Selection to get results for.
-            A Selection defines both spatial and time-like criteria for filtering.
-        set_ids:
-            Sets to get results for. Equivalent to modes.
-            Common to all simulation types for easier scripting.
-        all_sets:
-            Whether to get results for all sets/modes.
-        expand_cyclic:
-            For cyclic problems, whether to expand the sectors.
-            Can take a list of sector numbers to select specific sectors to expand
-            (one-based indexing).
-            If the problem is multi-stage, can take a list of lists of sector numbers, ordered
-            by stage.
-        phase_angle_cyclic:
-             For cyclic problems, phase angle to apply (in degrees).
-        external_layer:
-             Select the external layer (last layer of solid elements under the skin)
-             of the mesh for plotting and data extraction. If a list is passed, the external
-             layer is computed over list of elements.
-        skin:
-             Select the skin (creates new 2D elements connecting the external nodes)
-             of the mesh for plotting and data extraction. If a list is passed, the skin
-             is computed over list of elements (not supported for cyclic symmetry). Getting the
-             skin on more than one result (several time freq sets, split data...) is only
-             supported starting with Ansys 2023R2.
-
-        Returns
-        -------
-        Returns a :class:`ansys.dpf.post.data_object.DataFrame` instance.
-
-        """
+        """Extract elemental equivalent plastic strain results from the simulation."""
         return self._get_result(
-            base_name="ElementalMass",
-            location=locations.elemental,
-            category=ResultCategory.scalar,
+            base_name="EPPL",
+            location=_LOC_ELEMENTAL,
+            category=_CAT_EQUIVALENT,
             components=None,
             selection=selection,
             frequencies=frequencies,
             set_ids=set_ids,
             all_sets=all_sets,
             modes=modes,
-            node_ids=None,
             element_ids=element_ids,
             named_selections=named_selections,
             expand_cyclic=expand_cyclic,
@@ -3579,83 +3011,71 @@ class ModalMechanicalSimulation(MechanicalSimulation):
             skin=skin,
         )
 
-    def element_centroids(
+    @_cache_result_method
+    def reaction_force(
         self,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        set_ids: Union[int, List[int], None] = None,
+        node_ids: _Ids = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        components: _Components = None,
+        norm: bool = False,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
-        """Extract element centroids results from the simulation.
-
-        Arguments `selection`, `set_ids`, `all_sets`, `frequencies`, and `modes` are mutually
-        exclusive.
-        If none of the above is given, only the first mode will be returned.
-
-        Arguments `selection`, `named_selections`, and `element_ids` are mutually
-        exclusive.
-        If none of the above is given, results will be extracted for the whole mesh.
-
-        Parameters
-        ----------
-        element_ids:
-            List of IDs of elements to get results for.
-        frequencies:
-            Frequency value or list of frequency values to get results for.
-        modes:
-            Mode number or list of mode numbers to get results for.
-        named_selections:
-            Named selection or list of named selections to get results for.
-        selection:
-            Selection to get results for.
-            A Selection defines both spatial and time-like criteria for filtering.
-        set_ids:
-            Sets to get results for. Equivalent to modes.
-            Common to all simulation types for easier scripting.
-        all_sets:
-            Whether to get results for all sets/modes.
-        expand_cyclic:
-            For cyclic problems, whether to expand the sectors.
-            Can take a list of sector numbers to select specific sectors to expand
-            (one-based indexing).
-            If the problem is multi-stage, can take a list of lists of sector numbers, ordered
-            by stage.
-        phase_angle_cyclic:
-             For cyclic problems, phase angle to apply (in degrees).
-        external_layer:
-             Select the external layer (last layer of solid elements under the skin)
-             of the mesh for plotting and data extraction. If a list is passed, the external
-             layer is computed over list of elements.
-        skin:
-             Select the skin (creates new 2D elements connecting the external nodes)
-             of the mesh for plotting and data extraction. If a list is passed, the skin
-             is computed over list of elements (not supported for cyclic symmetry). Getting the
-             skin on more than one result (several time freq sets, split data...) is only
-             supported starting with Ansys 2023R2.
-
-        Returns
-        -------
-        Returns a :class:`ansys.dpf.post.data_object.DataFrame` instance.
+        """Extract reaction force results from the simulation."""
+        return self._get_result(
+            base_name="RF",
+            location=_LOC_NODAL,
+            category=_CAT_VECTOR,
+            components=components,
+            norm=norm,
+            selection=selection,
+            frequencies=frequencies,
+            set_ids=set_ids,
+            all_sets=all_sets,
+            modes=modes,
+            node_ids=node_ids,
+            element_ids=element_ids,
+            named_selections=named_selections,
+            expand_cyclic=expand_cyclic,
+            phase_angle_cyclic=phase_angle_cyclic,
+            external_layer=external_layer,
+            skin=skin,
+        )
 
-        """
+    @_cache_result_method
+    def elemental_volume(
+        self,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        set_ids: _Sets = None,
+        all_sets: bool = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
+    ) -> DataFrame:
+        """Extract elemental volume results from the simulation."""
         return self._get_result(
-            base_name="centroids",
-            location=locations.elemental,
-            category=ResultCategory.scalar,
+            base_name="ENG_VOL",
+            location=_LOC_ELEMENTAL,
+            category=_CAT_SCALAR,
             components=None,
             selection=selection,
             frequencies=frequencies,
             set_ids=set_ids,
             all_sets=all_sets,
             modes=modes,
-            node_ids=None,
             element_ids=element_ids,
             named_selections=named_selections,
             expand_cyclic=expand_cyclic,
@@ -3664,83 +3084,32 @@ class ModalMechanicalSimulation(MechanicalSimulation):
             skin=skin,
         )
 
-    def thickness(
+    @_cache_result_method
+    def elemental_mass(
         self,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        set_ids: Union[int, List[int], None] = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
-        """Extract element thickness results from the simulation.
-
-        Arguments `selection`, `set_ids`, `all_sets`, `frequencies`, and `modes` are mutually
-        exclusive.
-        If none of the above is given, only the first mode will be returned.
-
-        Arguments `selection`, `named_selections`, and `element_ids` are mutually
-        exclusive.
-        If none of the above is given, results will be extracted for the whole mesh.
-
-        Parameters
-        ----------
-        element_ids:
-            List of IDs of elements to get results for.
-        frequencies:
-            Frequency value or list of frequency values to get results for.
-        modes:
-            Mode number or list of mode numbers to get results for.
-        named_selections:
-            Named selection or list of named selections to get results for.
-        selection:
-            Selection to get results for.
-            A Selection defines both spatial and time-like criteria for filtering.
-        set_ids:
-            Sets to get results for. Equivalent to modes.
-            Common to all simulation types for easier scripting.
-        all_sets:
-            Whether to get results for all sets/modes.
-        expand_cyclic:
-            For cyclic problems, whether to expand the sectors.
-            Can take a list of sector numbers to select specific sectors to expand
-            (one-based indexing).
-            If the problem is multi-stage, can take a list of lists of sector numbers, ordered
-            by stage.
-        phase_angle_cyclic:
-             For cyclic problems, phase angle to apply (in degrees).
-        external_layer:
-             Select the external layer (last layer of solid elements under the skin)
-             of the mesh for plotting and data extraction. If a list is passed, the external
-             layer is computed over list of elements.
-        skin:
-             Select the skin (creates new 2D elements connecting the external nodes)
-             of the mesh for plotting and data extraction. If a list is passed, the skin
-             is computed over list of elements (not supported for cyclic symmetry). Getting the
-             skin on more than one result (several time freq sets, split data...) is only
-             supported starting with Ansys 2023R2.
-
-        Returns
-        -------
-        Returns a :class:`ansys.dpf.post.data_object.DataFrame` instance.
-
-        """
+        """Extract elemental mass results from the simulation."""
         return self._get_result(
-            base_name="thickness",
-            location=locations.elemental,
-            category=ResultCategory.scalar,
+            base_name="ElementalMass",
+            location=_LOC_ELEMENTAL,
+            category=_CAT_SCALAR,
             components=None,
             selection=selection,
             frequencies=frequencies,
             set_ids=set_ids,
             all_sets=all_sets,
             modes=modes,
-            node_ids=None,
             element_ids=element_ids,
             named_selections=named_selections,
             expand_cyclic=expand_cyclic,
@@ -3749,95 +3118,32 @@ class ModalMechanicalSimulation(MechanicalSimulation):
             skin=skin,
         )
 
-    def element_orientations(
+    @_cache_result_method
+    def element_centroids(
         self,
-        node_ids: Union[List[int], None] = None,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        location: Union[locations, str] = locations.elemental_nodal,
-        set_ids: Union[int, List[int], None] = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
-        """Extract elemental nodal element orientations results from the simulation.
-
-        Arguments `selection`, `set_ids`, `all_sets`, `frequencies`, and `modes` are mutually
-        exclusive.
-        If none of the above is given, only the first mode will be returned.
-
-        Arguments `selection`, `named_selections`, `element_ids`, and `node_ids` are mutually
-        exclusive.
-        If none of the above is given, results will be extracted for the whole mesh.
-
-        Parameters
-        ----------
-        node_ids:
-            List of IDs of nodes to get results for.
-        element_ids:
-            List of IDs of elements to get results for.
-        frequencies:
-            Frequency value or list of frequency values to get results for.
-        modes:
-            Mode number or list of mode numbers to get results for.
-        named_selections:
-            Named selection or list of named selections to get results for.
-        selection:
-            Selection to get results for.
-            A Selection defines both spatial and time-like criteria for filtering.
-        location:
-            Location to extract results at. Available locations are listed in
-            class:`post.locations` and are: `post.locations.nodal`,
-            `post.locations.elemental`, and `post.locations.elemental_nodal`.
-            Using the default `post.locations.elemental_nodal` results in a value
-            for every node at each element. Similarly, using `post.locations.elemental`
-            gives results with one value for each element, while using `post.locations.nodal`
-            gives results with one value for each node.
-        set_ids:
-            Sets to get results for. Equivalent to modes.
-            Common to all simulation types for easier scripting.
-        all_sets:
-            Whether to get results for all sets/modes.
-        expand_cyclic:
-            For cyclic problems, whether to expand the sectors.
-            Can take a list of sector numbers to select specific sectors to expand
-            (one-based indexing).
-            If the problem is multi-stage, can take a list of lists of sector numbers, ordered
-            by stage.
-        phase_angle_cyclic:
-             For cyclic problems, phase angle to apply (in degrees).
-        external_layer:
-             Select the external layer (last layer of solid elements under the skin)
-             of the mesh for plotting and data extraction. If a list is passed, the external
-             layer is computed over list of elements.
-        skin:
-             Select the skin (creates new 2D elements connecting the external nodes)
-             of the mesh for plotting and data extraction. If a list is passed, the skin
-             is computed over list of elements (not supported for cyclic symmetry). Getting the
-             skin on more than one result (several time freq sets, split data...) is only
-             supported starting with Ansys 2023R2.
-
-        Returns
-        -------
-        Returns a :class:`ansys.dpf.post.data_object.DataFrame` instance.
-
-        """
+        """Extract element centroids results from the simulation."""
         return self._get_result(
-            base_name="EUL",
-            location=location,
-            category=ResultCategory.scalar,
+            base_name="centroids",
+            location=_LOC_ELEMENTAL,
+            category=_CAT_SCALAR,
             components=None,
             selection=selection,
             frequencies=frequencies,
             set_ids=set_ids,
             all_sets=all_sets,
             modes=modes,
-            node_ids=node_ids,
             element_ids=element_ids,
             named_selections=named_selections,
             expand_cyclic=expand_cyclic,
@@ -3846,83 +3152,32 @@ class ModalMechanicalSimulation(MechanicalSimulation):
             skin=skin,
         )
 
-    def element_orientations_elemental(
+    @_cache_result_method
+    def thickness(
         self,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        set_ids: Union[int, List[int], None] = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
-        """Extract elemental element orientations results from the simulation.
-
-        Arguments `selection`, `set_ids`, `all_sets`, `frequencies`, and `modes` are mutually
-        exclusive.
-        If none of the above is given, only the first mode will be returned.
-
-        Arguments `selection`, `named_selections`, and `element_ids` are mutually
-        exclusive.
-        If none of the above is given, results will be extracted for the whole mesh.
-
-        Parameters
-        ----------
-        element_ids:
-            List of IDs of elements to get results for.
-        frequencies:
-            Frequency value or list of frequency values to get results for.
-        modes:
-            Mode number or list of mode numbers to get results for.
-        named_selections:
-            Named selection or list of named selections to get results for.
-        selection:
-            Selection to get results for.
-            A Selection defines both spatial and time-like criteria for filtering.
-        set_ids:
-            Sets to get results for. Equivalent to modes.
-            Common to all simulation types for easier scripting.
-        all_sets:
-            Whether to get results for all sets/modes.
-        expand_cyclic:
-            For cyclic problems, whether to expand the sectors.
-            Can take a list of sector numbers to select specific sectors to expand
-            (one-based indexing).
-            If the problem is multi-stage, can take a list of lists of sector numbers, ordered
-            by stage.
-        phase_angle_cyclic:
-             For cyclic problems, phase angle to apply (in degrees).
-        external_layer:
-             Select the external layer (last layer of solid elements under the skin)
-             of the mesh for plotting and data extraction. If a list is passed, the external
-             layer is computed over list of elements.
-        skin:
-             Select the skin (creates new 2D elements connecting the external nodes)
-             of the mesh for plotting and data extraction. If a list is passed, the skin
-             is computed over list of elements (not supported for cyclic symmetry). Getting the
-             skin on more than one result (several time freq sets, split data...) is only
-             supported starting with Ansys 2023R2.
-
-        Returns
-        -------
-        Returns a :class:`ansys.dpf.post.data_object.DataFrame` instance.
-
-        """
+        """Extract element thickness results from the simulation."""
         return self._get_result(
-            base_name="EUL",
-            location=locations.elemental,
-            category=ResultCategory.scalar,
+            base_name="thickness",
+            location=_LOC_ELEMENTAL,
+            category=_CAT_SCALAR,
             components=None,
             selection=selection,
             frequencies=frequencies,
             set_ids=set_ids,
             all_sets=all_sets,
             modes=modes,
-            node_ids=None,
             element_ids=element_ids,
             named_selections=named_selections,
             expand_cyclic=expand_cyclic,
@@ -3931,86 +3186,69 @@ class ModalMechanicalSimulation(MechanicalSimulation):
             skin=skin,
         )
 
-    def element_orientations_nodal(
+    @_cache_result_method
+    def element_orientations(
         self,
-        node_ids: Union[List[int], None] = None,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        set_ids: Union[int, List[int], None] = None,
+        node_ids: _Ids = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        location: _Location = locations.elemental_nodal,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
-        """Extract nodal element orientations results from the simulation.
-
-        Arguments `selection`, `set_ids`, `all_sets`, `frequencies`, and `modes` are mutually
-        exclusive.
-        If none of the above is given, only the first mode will be returned.
-
-        Arguments `selection`, `named_selections`, `element_ids`, and `node_ids` are mutually
-        exclusive.
-        If none of the above is given, results will be extracted for the whole mesh.
-
-        Parameters
-        ----------
-        node_ids:
-            List of IDs of nodes to get results for.
-        element_ids:
-            List of IDs of elements to get results for.
-        frequencies:
-            Frequency value or list of frequency values to get results for.
-        modes:
-            Mode number or list of mode numbers to get results for.
-        named_selections:
-            Named selection or list of named selections to get results for.
-        selection:
-            Selection to get results for.
-            A Selection defines both spatial and time-like criteria for filtering.
-        set_ids:
-            Sets to get results for. Equivalent to modes.
-            Common to all simulation types for easier scripting.
-        all_sets:
-            Whether to get results for all sets/modes.
-        expand_cyclic:
-            For cyclic problems, whether to expand the sectors.
-            Can take a list of sector numbers to select specific sectors to expand
-            (one-based indexing).
-            If the problem is multi-stage, can take a list of lists of sector numbers, ordered
-            by stage.
-        phase_angle_cyclic:
-             For cyclic problems, phase angle to apply (in degrees).
-        external_layer:
-             Select the external layer (last layer of solid elements under the skin)
-             of the mesh for plotting and data extraction. If a list is passed, the external
-             layer is computed over list of elements.
-        skin:
-             Select the skin (creates new 2D elements connecting the external nodes)
-             of the mesh for plotting and data extraction. If a list is passed, the skin
-             is computed over list of elements (not supported for cyclic symmetry). Getting the
-             skin on more than one result (several time freq sets, split data...) is only
-             supported starting with Ansys 2023R2.
-
-        Returns
-        -------
-        Returns a :class:`ansys.dpf.post.data_object.DataFrame` instance.
+        """Extract elemental nodal element orientations results from the simulation."""
+        return self._get_result(
+            base_name="EUL",
+            location=location,
+            category=_CAT_SCALAR,
+            components=None,
+            selection=selection,
+            frequencies=frequencies,
+            set_ids=set_ids,
+            all_sets=all_sets,
+            modes=modes,
+            node_ids=node_ids,
+            element_ids=element_ids,
+            named_selections=named_selections,
+            expand_cyclic=expand_cyclic,
+            phase_angle_cyclic=phase_angle_cyclic,
+            external_layer=external_layer,
+            skin=skin,
+        )
 
-        """
+    @_cache_result_method
+    def element_orientations_elemental(
+        self,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        set_ids: _Sets = None,
+        all_sets: bool = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
+    ) -> DataFrame:
+        """Extract elemental element orientations results from the simulation."""
         return self._get_result(
             base_name="EUL",
-            location=locations.nodal,
-            category=ResultCategory.scalar,
+            location=_LOC_ELEMENTAL,
+            category=_CAT_SCALAR,
             components=None,
             selection=selection,
             frequencies=frequencies,
             set_ids=set_ids,
             all_sets=all_sets,
             modes=modes,
-            node_ids=node_ids,
             element_ids=element_ids,
             named_selections=named_selections,
             expand_cyclic=expand_cyclic,
@@ -4019,88 +3257,27 @@ class ModalMechanicalSimulation(MechanicalSimulation):
             skin=skin,
         )
 
-    def hydrostatic_pressure(
+    @_cache_result_method
+    def element_orientations_nodal(
         self,
-        node_ids: Union[List[int], None] = None,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        location: Union[locations, str] = locations.elemental_nodal,
-        set_ids: Union[int, List[int], None] = None,
+        node_ids: _Ids = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
-        """Extract hydrostatic pressure element nodal results from the simulation.
-
-        Arguments `selection`, `set_ids`, `all_sets`, `frequencies`, and `modes` are mutually
-        exclusive.
-        If none of the above is given, only the first mode will be returned.
-
-        Arguments `selection`, `named_selections`, `element_ids`, and `node_ids` are mutually
-        exclusive.
-        If none of the above is given, results will be extracted for the whole mesh.
-
-        Parameters
-        ----------
-        node_ids:
-            List of IDs of nodes to get results for.
-        element_ids:
-            List of IDs of elements to get results for.
-        frequencies:
-            Frequency value or list of frequency values to get results for.
-        modes:
-            Mode number or list of mode numbers to get results for.
-        named_selections:
-            Named selection or list of named selections to get results for.
-        selection:
-            Selection to get results for.
-            A Selection defines both spatial and time-like criteria for filtering.
-        location:
-            Location to extract results at. Available locations are listed in
-            class:`post.locations` and are: `post.locations.nodal`,
-            `post.locations.elemental`, and `post.locations.elemental_nodal`.
-            Using the default `post.locations.elemental_nodal` results in a value
-            for every node at each element. Similarly, using `post.locations.elemental`
-            gives results with one value for each element, while using `post.locations.nodal`
-            gives results with one value for each node.
-        set_ids:
-            Sets to get results for. Equivalent to modes.
-            Common to all simulation types for easier scripting.
-        all_sets:
-            Whether to get results for all sets/modes.
-        expand_cyclic:
-            For cyclic problems, whether to expand the sectors.
-            Can take a list of sector numbers to select specific sectors to expand
-            (one-based indexing).
-            If the problem is multi-stage, can take a list of lists of sector numbers, ordered
-            by stage.
-        phase_angle_cyclic:
-             For cyclic problems, phase angle to apply (in degrees).
-        external_layer:
-             Select the external layer (last layer of solid elements under the skin)
-             of the mesh for plotting and data extraction. If a list is passed, the external
-             layer is computed over list of elements.
-        skin:
-             Select the skin (creates new 2D elements connecting the external nodes)
-             of the mesh for plotting and data extraction. If a list is passed, the skin
-             is computed over list of elements (not supported for cyclic symmetry). Getting the
-             skin on more than one result (several time freq sets, split data...) is only
-             supported starting with Ansys 2023R2.
-
-        Returns
-        -------
-        Returns a :class:`ansys.dpf.post.data_object.DataFrame` instance.
-
-        """
+        """Extract nodal element orientations results from the simulation."""
         return self._get_result(
-            base_name="ENL_HPRES",
-            location=location,
-            category=ResultCategory.scalar,
+            base_name="EUL",
+            location=_LOC_NODAL,
+            category=_CAT_SCALAR,
             components=None,
             selection=selection,
             frequencies=frequencies,
@@ -4116,79 +3293,28 @@ class ModalMechanicalSimulation(MechanicalSimulation):
             skin=skin,
         )
 
-    def hydrostatic_pressure_nodal(
+    @_cache_result_method
+    def hydrostatic_pressure(
         self,
-        node_ids: Union[List[int], None] = None,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        set_ids: Union[int, List[int], None] = None,
+        node_ids: _Ids = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        location: _Location = locations.elemental_nodal,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
-        """Extract hydrostatic pressure nodal results from the simulation.
-
-        Arguments `selection`, `set_ids`, `all_sets`, `frequencies`, and `modes` are mutually
-        exclusive.
-        If none of the above is given, only the first mode will be returned.
-
-        Arguments `selection`, `named_selections`, `element_ids`, and `node_ids` are mutually
-        exclusive.
-        If none of the above is given, results will be extracted for the whole mesh.
-
-        Parameters
-        ----------
-        node_ids:
-            List of IDs of nodes to get results for.
-        element_ids:
-            List of IDs of elements to get results for.
-        frequencies:
-            Frequency value or list of frequency values to get results for.
-        modes:
-            Mode number or list of mode numbers to get results for.
-        named_selections:
-            Named selection or list of named selections to get results for.
-        selection:
-            Selection to get results for.
-            A Selection defines both spatial and time-like criteria for filtering.
-        set_ids:
-            Sets to get results for. Equivalent to modes.
-            Common to all simulation types for easier scripting.
-        all_sets:
-            Whether to get results for all sets/modes.
-        expand_cyclic:
-            For cyclic problems, whether to expand the sectors.
-            Can take a list of sector numbers to select specific sectors to expand
-            (one-based indexing).
-            If the problem is multi-stage, can take a list of lists of sector numbers, ordered
-            by stage.
-        phase_angle_cyclic:
-             For cyclic problems, phase angle to apply (in degrees).
-        external_layer:
-             Select the external layer (last layer of solid elements under the skin)
-             of the mesh for plotting and data extraction. If a list is passed, the external
-             layer is computed over list of elements.
-        skin:
-             Select the skin (creates new 2D elements connecting the external nodes)
-             of the mesh for plotting and data extraction. If a list is passed, the skin
-             is computed over list of elements (not supported for cyclic symmetry). Getting the
-             skin on more than one result (several time freq sets, split data...) is only
-             supported starting with Ansys 2023R2.
-
-        Returns
-        -------
-        Returns a :class:`ansys.dpf.post.data_object.DataFrame` instance.
-
-        """
+        """Extract hydrostatic pressure element nodal results from the simulation."""
         return self._get_result(
             base_name="ENL_HPRES",
-            location=locations.nodal,
-            category=ResultCategory.scalar,
+            location=location,
+            category=_CAT_SCALAR,
             components=None,
             selection=selection,
             frequencies=frequencies,
@@ -4204,83 +3330,34 @@ class ModalMechanicalSimulation(MechanicalSimulation):
             skin=skin,
         )
 
-    def hydrostatic_pressure_elemental(
+    @_cache_result_method
+    def hydrostatic_pressure_nodal(
         self,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        set_ids: Union[int, List[int], None] = None,
+        node_ids: _Ids = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
-        """Extract hydrostatic pressure elemental results from the simulation.
-
-        Arguments `selection`, `set_ids`, `all_sets`, `frequencies`, and `modes` are mutually
-        exclusive.
-        If none of the above is given, only the first mode will be returned.
-
-        Arguments `selection`, `named_selections`, and `element_ids` are mutually
-        exclusive.
-        If none of the above is given, results will be extracted for the whole mesh.
-
-        Parameters
-        ----------
-        element_ids:
-            List of IDs of elements to get results for.
-        frequencies:
-            Frequency value or list of frequency values to get results for.
-        modes:
-            Mode number or list of mode numbers to get results for.
-        named_selections:
-            Named selection or list of named selections to get results for.
-        selection:
-            Selection to get results for.
-            A Selection defines both spatial and time-like criteria for filtering.
-        set_ids:
-            Sets to get results for. Equivalent to modes.
-            Common to all simulation types for easier scripting.
-        all_sets:
-            Whether to get results for all sets/modes.
-        expand_cyclic:
-            For cyclic problems, whether to expand the sectors.
-            Can take a list of sector numbers to select specific sectors to expand
-            (one-based indexing).
-            If the problem is multi-stage, can take a list of lists of sector numbers, ordered
-            by stage.
-        phase_angle_cyclic:
-             For cyclic problems, phase angle to apply (in degrees).
-        external_layer:
-             Select the external layer (last layer of solid elements under the skin)
-             of the mesh for plotting and data extraction. If a list is passed, the external
-             layer is computed over list of elements.
-        skin:
-             Select the skin (creates new 2D elements connecting the external nodes)
-             of the mesh for plotting and data extraction. If a list is passed, the skin
-             is computed over list of elements (not supported for cyclic symmetry). Getting the
-             skin on more than one result (several time freq sets, split data...) is only
-             supported starting with Ansys 2023R2.
-
-        Returns
-        -------
-        Returns a :class:`ansys.dpf.post.data_object.DataFrame` instance.
-
-        """
+        """Extract hydrostatic pressure nodal results from the simulation."""
         return self._get_result(
             base_name="ENL_HPRES",
-            location=locations.elemental,
-            category=ResultCategory.scalar,
+            location=_LOC_NODAL,
+            category=_CAT_SCALAR,
             components=None,
             selection=selection,
             frequencies=frequencies,
             set_ids=set_ids,
             all_sets=all_sets,
             modes=modes,
-            node_ids=None,
+            node_ids=node_ids,
             element_ids=element_ids,
             named_selections=named_selections,
             expand_cyclic=expand_cyclic,
@@ -4289,95 +3366,64 @@ class ModalMechanicalSimulation(MechanicalSimulation):
             skin=skin,
         )
 
-    def element_nodal_forces(
+    @_cache_result_method
+    def hydrostatic_pressure_elemental(
         self,
-        node_ids: Union[List[int], None] = None,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        components: Union[str, List[str], int, List[int], None] = None,
-        norm: bool = False,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        location: Union[locations, str] = locations.elemental_nodal,
-        set_ids: Union[int, List[int], None] = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
-        """Extract element nodal forces results from the simulation.
-
-        Arguments `selection`, `set_ids`, `all_sets`, `frequencies`, and `modes` are mutually
-        exclusive.
-        If none of the above is given, only the first mode will be returned.
-
-        Arguments `selection`, `named_selections`, `element_ids`, and `node_ids` are mutually
-        exclusive.
-        If none of the above is given, results will be extracted for the whole mesh.
-
-        Parameters
-        ----------
-        node_ids:
-            List of IDs of nodes to get results for.
-        element_ids:
-            List of IDs of elements to get results for.
-        frequencies:
-            Frequency value or list of frequency values to get results for.
-        components:
-            Components to get results for. Available components are "X", "Y", "Z",
-            and their respective equivalents 1, 2, 3.
-        norm:
-            Whether to return the norm of the results.
-        modes:
-            Mode number or list of mode numbers to get results for.
-        named_selections:
-            Named selection or list of named selections to get results for.
-        selection:
-            Selection to get results for.
-            A Selection defines both spatial and time-like criteria for filtering.
-        location:
-            Location to extract results at. Available locations are listed in
-            class:`post.locations` and are: `post.locations.nodal`,
-            `post.locations.elemental`, and `post.locations.elemental_nodal`.
-            Using the default `post.locations.elemental_nodal` results in a value
-            for every node at each element. Similarly, using `post.locations.elemental`
-            gives results with one value for each element, while using `post.locations.nodal`
-            gives results with one value for each node.
-        set_ids:
-            Sets to get results for. Equivalent to modes.
-            Common to all simulation types for easier scripting.
-        all_sets:
-            Whether to get results for all sets/modes.
-        expand_cyclic:
-            For cyclic problems, whether to expand the sectors.
-            Can take a list of sector numbers to select specific sectors to expand
-            (one-based indexing).
-            If the problem is multi-stage, can take a list of lists of sector numbers, ordered
-            by stage.
-        phase_angle_cyclic:
-             For cyclic problems, phase angle to apply (in degrees).
-        external_layer:
-             Select the external layer (last layer of solid elements under the skin)
-             of the mesh for plotting and data extraction. If a list is passed, the external
-             layer is computed over list of elements.
-        skin:
-             Select the skin (creates new 2D elements connecting the external nodes)
-             of the mesh for plotting and data extraction. If a list is passed, the skin
-             is computed over list of elements (not supported for cyclic symmetry). Getting the
-             skin on more than one result (several time freq sets, split data...) is only
-             supported starting with Ansys 2023R2.
-
-        Returns
-        -------
-        Returns a :class:`ansys.dpf.post.data_object.DataFrame` instance.
+        """Extract hydrostatic pressure elemental results from the simulation."""
+        return self._get_result(
+            base_name="ENL_HPRES",
+            location=_LOC_ELEMENTAL,
+            category=_CAT_SCALAR,
+            components=None,
+            selection=selection,
+            frequencies=frequencies,
+            set_ids=set_ids,
+            all_sets=all_sets,
+            modes=modes,
+            element_ids=element_ids,
+            named_selections=named_selections,
+            expand_cyclic=expand_cyclic,
+            phase_angle_cyclic=phase_angle_cyclic,
+            external_layer=external_layer,
+            skin=skin,
+        )
 
-        """
+    @_cache_result_method
+    def element_nodal_forces(
+        self,
+        node_ids: _Ids = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        components: _Components = None,
+        norm: bool = False,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        location: _Location = locations.elemental_nodal,
+        set_ids: _Sets = None,
+        all_sets: bool = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
+    ) -> DataFrame:
+        """Extract element nodal forces results from the simulation."""
         return self._get_result(
             base_name="ENF",
             location=location,
-            category=ResultCategory.vector,
+            category=_CAT_VECTOR,
             components=components,
             norm=norm,
             selection=selection,
@@ -4394,86 +3440,29 @@ class ModalMechanicalSimulation(MechanicalSimulation):
             skin=skin,
         )
 
+    @_cache_result_method
     def element_nodal_forces_nodal(
         self,
-        node_ids: Union[List[int], None] = None,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        components: Union[str, List[str], int, List[int], None] = None,
+        node_ids: _Ids = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        components: _Components = None,
         norm: bool = False,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        set_ids: Union[int, List[int], None] = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
-        """Extract element nodal forces nodal results from the simulation.
-
-        Arguments `selection`, `set_ids`, `all_sets`, `frequencies`, and `modes` are mutually
-        exclusive.
-        If none of the above is given, only the first mode will be returned.
-
-        Arguments `selection`, `named_selections`, `element_ids`, and `node_ids` are mutually
-        exclusive.
-        If none of the above is given, results will be extracted for the whole mesh.
-
-        Parameters
-        ----------
-        node_ids:
-            List of IDs of nodes to get results for.
-        element_ids:
-            List of IDs of elements to get results for.
-        frequencies:
-            Frequency value or list of frequency values to get results for.
-        components:
-            Components to get results for. Available components are "X", "Y", "Z",
-            and their respective equivalents 1, 2, 3.
-        norm:
-            Whether to return the norm of the results.
-        modes:
-            Mode number or list of mode numbers to get results for.
-        named_selections:
-            Named selection or list of named selections to get results for.
-        selection:
-            Selection to get results for.
-            A Selection defines both spatial and time-like criteria for filtering.
-        set_ids:
-            Sets to get results for. Equivalent to modes.
-            Common to all simulation types for easier scripting.
-        all_sets:
-            Whether to get results for all sets/modes.
-        expand_cyclic:
-            For cyclic problems, whether to expand the sectors.
-            Can take a list of sector numbers to select specific sectors to expand
-            (one-based indexing).
-            If the problem is multi-stage, can take a list of lists of sector numbers, ordered
-            by stage.
-        phase_angle_cyclic:
-             For cyclic problems, phase angle to apply (in degrees).
-        external_layer:
-             Select the external layer (last layer of solid elements under the skin)
-             of the mesh for plotting and data extraction. If a list is passed, the external
-             layer is computed over list of elements.
-        skin:
-             Select the skin (creates new 2D elements connecting the external nodes)
-             of the mesh for plotting and data extraction. If a list is passed, the skin
-             is computed over list of elements (not supported for cyclic symmetry). Getting the
-             skin on more than one result (several time freq sets, split data...) is only
-             supported starting with Ansys 2023R2.
-
-        Returns
-        -------
-        Returns a :class:`ansys.dpf.post.data_object.DataFrame` instance.
-
-        """
+        """Extract element nodal forces nodal results from the simulation."""
         return self._get_result(
             base_name="ENF",
-            location=locations.nodal,
-            category=ResultCategory.vector,
+            location=_LOC_NODAL,
+            category=_CAT_VECTOR,
             components=components,
             norm=norm,
             selection=selection,
@@ -4490,83 +3479,28 @@ class ModalMechanicalSimulation(MechanicalSimulation):
             skin=skin,
         )
 
+    @_cache_result_method
     def element_nodal_forces_elemental(
         self,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        components: Union[str, List[str], int, List[int], None] = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        components: _Components = None,
         norm: bool = False,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        set_ids: Union[int, List[int], None] = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
-        """Extract element nodal forces elemental results from the simulation.
-
-        Arguments `selection`, `set_ids`, `all_sets`, `frequencies`, and `modes` are mutually
-        exclusive.
-        If none of the above is given, only the first mode will be returned.
-
-        Arguments `selection`, `named_selections`, and `element_ids` are mutually
-        exclusive.
-        If none of the above is given, results will be extracted for the whole mesh.
-
-        Parameters
-        ----------
-        element_ids:
-            List of IDs of elements to get results for.
-        frequencies:
-            Frequency value or list of frequency values to get results for.
-        components:
-            Components to get results for. Available components are "X", "Y", "Z",
-            and their respective equivalents 1, 2, 3.
-        norm:
-            Whether to return the norm of the results.
-        modes:
-            Mode number or list of mode numbers to get results for.
-        named_selections:
-            Named selection or list of named selections to get results for.
-        selection:
-            Selection to get results for.
-            A Selection defines both spatial and time-like criteria for filtering.
-        set_ids:
-            Sets to get results for. Equivalent to modes.
-            Common to all simulation types for easier scripting.
-        all_sets:
-            Whether to get results for all sets/modes.
-        expand_cyclic:
-            For cyclic problems, whether to expand the sectors.
-            Can take a list of sector numbers to select specific sectors to expand
-            (one-based indexing).
-            If the problem is multi-stage, can take a list of lists of sector numbers, ordered
-            by stage.
-        phase_angle_cyclic:
-             For cyclic problems, phase angle to apply (in degrees).
-        external_layer:
-             Select the external layer (last layer of solid elements under the skin)
-             of the mesh for plotting and data extraction. If a list is passed, the external
-             layer is computed over list of elements.
-        skin:
-             Select the skin (creates new 2D elements connecting the external nodes)
-             of the mesh for plotting and data extraction. If a list is passed, the skin
-             is computed over list of elements (not supported for cyclic symmetry). Getting the
-             skin on more than one result (several time freq sets, split data...) is only
-             supported starting with Ansys 2023R2.
-
-        Returns
-        -------
-        Returns a :class:`ansys.dpf.post.data_object.DataFrame` instance.
-
-        """
+        """Extract element nodal forces elemental results from the simulation."""
         return self._get_result(
             base_name="ENF",
-            location=locations.elemental,
-            category=ResultCategory.vector,
+            location=_LOC_ELEMENTAL,
+            category=_CAT_VECTOR,
             components=components,
             norm=norm,
             selection=selection,
@@ -4574,7 +3508,6 @@ class ModalMechanicalSimulation(MechanicalSimulation):
             set_ids=set_ids,
             all_sets=all_sets,
             modes=modes,
-            node_ids=None,
             element_ids=element_ids,
             named_selections=named_selections,
             expand_cyclic=expand_cyclic,
@@ -4583,86 +3516,29 @@ class ModalMechanicalSimulation(MechanicalSimulation):
             skin=skin,
         )
 
+    @_cache_result_method
     def nodal_force(
         self,
-        node_ids: Union[List[int], None] = None,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        components: Union[str, List[str], int, List[int], None] = None,
+        node_ids: _Ids = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        components: _Components = None,
         norm: bool = False,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        set_ids: Union[int, List[int], None] = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
-        """Extract nodal force results from the simulation.
-
-        Arguments `selection`, `set_ids`, `all_sets`, `frequencies`, and `modes` are mutually
-        exclusive.
-        If none of the above is given, only the first mode will be returned.
-
-        Arguments `selection`, `named_selections`, `element_ids`, and `node_ids` are mutually
-        exclusive.
-        If none of the above is given, results will be extracted for the whole mesh.
-
-        Parameters
-        ----------
-        node_ids:
-            List of IDs of nodes to get results for.
-        element_ids:
-            List of IDs of elements whose nodes to get results for.
-        frequencies:
-            Frequency value or list of frequency values to get results for.
-        components:
-            Components to get results for. Available components are "X", "Y", "Z",
-            and their respective equivalents 1, 2, 3.
-        norm:
-            Whether to return the norm of the results.
-        modes:
-            Mode number or list of mode numbers to get results for.
-        named_selections:
-            Named selection or list of named selections to get results for.
-        selection:
-            Selection to get results for.
-            A Selection defines both spatial and time-like criteria for filtering.
-        set_ids:
-            Sets to get results for. Equivalent to modes.
-            Common to all simulation types for easier scripting.
-        all_sets:
-            Whether to get results for all sets/modes.
-        expand_cyclic:
-            For cyclic problems, whether to expand the sectors.
-            Can take a list of sector numbers to select specific sectors to expand
-            (one-based indexing).
-            If the problem is multi-stage, can take a list of lists of sector numbers, ordered
-            by stage.
-        phase_angle_cyclic:
-             For cyclic problems, phase angle to apply (in degrees).
-        external_layer:
-             Select the external layer (last layer of solid elements under the skin)
-             of the mesh for plotting and data extraction. If a list is passed, the external
-             layer is computed over list of elements.
-        skin:
-             Select the skin (creates new 2D elements connecting the external nodes)
-             of the mesh for plotting and data extraction. If a list is passed, the skin
-             is computed over list of elements (not supported for cyclic symmetry). Getting the
-             skin on more than one result (several time freq sets, split data...) is only
-             supported starting with Ansys 2023R2.
-
-        Returns
-        -------
-        Returns a :class:`ansys.dpf.post.data_object.DataFrame` instance.
-
-        """
+        """Extract nodal force results from the simulation."""
         return self._get_result(
             base_name="F",
-            location=locations.nodal,
-            category=ResultCategory.vector,
+            location=_LOC_NODAL,
+            category=_CAT_VECTOR,
             components=components,
             norm=norm,
             selection=selection,
@@ -4679,86 +3555,29 @@ class ModalMechanicalSimulation(MechanicalSimulation):
             skin=skin,
         )
 
+    @_cache_result_method
     def nodal_moment(
         self,
-        node_ids: Union[List[int], None] = None,
-        element_ids: Union[List[int], None] = None,
-        frequencies: Union[float, List[float], None] = None,
-        components: Union[str, List[str], int, List[int], None] = None,
+        node_ids: _Ids = None,
+        element_ids: _Ids = None,
+        frequencies: _Freqs = None,
+        components: _Components = None,
         norm: bool = False,
-        modes: Union[int, List[int], None] = None,
-        named_selections: Union[List[str], str, None] = None,
-        selection: Union[Selection, None] = None,
-        set_ids: Union[int, List[int], None] = None,
+        modes: _Sets = None,
+        named_selections: _NamedSelections = None,
+        selection: _OptSelection = None,
+        set_ids: _Sets = None,
         all_sets: bool = False,
-        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
-        phase_angle_cyclic: Union[float, None] = None,
-        external_layer: Union[bool, List[int]] = False,
-        skin: Union[bool, List[int]] = False,
+        expand_cyclic: _ExpandCyclic = True,
+        phase_angle_cyclic: _PhaseAngleCyclic = None,
+        external_layer: _ElementSubset = False,
+        skin: _ElementSubset = False,
     ) -> DataFrame:
-        """Extract nodal moment results from the simulation.
-
-        Arguments `selection`, `set_ids`, `all_sets`, `frequencies`, and `modes` are mutually
-        exclusive.
-        If none of the above is given, only the first mode will be returned.
-
-        Arguments `selection`, `named_selections`, `element_ids`, and `node_ids` are mutually
-        exclusive.
-        If none of the above is given, results will be extracted for the whole mesh.
-
-        Parameters
-        ----------
-        node_ids:
-            List of IDs of nodes to get results for.
-        element_ids:
-            List of IDs of elements whose nodes to get results for.
-        frequencies:
-            Frequency value or list of frequency values to get results for.
-        components:
-            Components to get results for. Available components are "X", "Y", "Z",
-            and their respective equivalents 1, 2, 3.
-        norm:
-            Whether to return the norm of the results.
-        modes:
-            Mode number or list of mode numbers to get results for.
-        named_selections:
-            Named selection or list of named selections to get results for.
-        selection:
-            Selection to get results for.
-            A Selection defines both spatial and time-like criteria for filtering.
-        set_ids:
-            Sets to get results for. Equivalent to modes.
-            Common to all simulation types for easier scripting.
-        all_sets:
-            Whether to get results for all sets/modes.
-        expand_cyclic:
-            For cyclic problems, whether to expand the sectors.
-            Can take a list of sector numbers to select specific sectors to expand
-            (one-based indexing).
-            If the problem is multi-stage, can take a list of lists of sector numbers, ordered
-            by stage.
-        phase_angle_cyclic:
-             For cyclic problems, phase angle to apply (in degrees).
-        external_layer:
-             Select the external layer (last layer of solid elements under the skin)
-             of the mesh for plotting and data extraction. If a list is passed, the external
-             layer is computed over list of elements.
-        skin:
-             Select the skin (creates new 2D elements connecting the external nodes)
-             of the mesh for plotting and data extraction. If a list is passed, the skin
-             is computed over list of elements (not supported for cyclic symmetry). Getting the
-             skin on more than one result (several time freq sets, split data...) is only
-             supported starting with Ansys 2023R2.
-
-        Returns
-        -------
-        Returns a :class:`ansys.dpf.post.data_object.DataFrame` instance.
-
-        """
+        """Extract nodal moment results from the simulation."""
         return self._get_result(
             base_name="M",
-            location=locations.nodal,
-            category=ResultCategory.vector,
+            location=_LOC_NODAL,
+            category=_CAT_VECTOR,
             components=components,
             norm=norm,
             selection=selection,
@@ -4774,3 +3593,59 @@ class ModalMechanicalSimulation(MechanicalSimulation):
             external_layer=external_layer,
             skin=skin,
         )
+
+
+# The docstrings of the plastic result methods are identical up to the result
+# name and the parameters present in each signature. Their shared body is
+# rendered once here from the templates in :mod:`ansys.dpf.post._docs`.
+_set_result_docstrings(
+    ModalMechanicalSimulation,
+    {
+        "plastic_state_variable": None,
+        "plastic_state_variable_elemental": None,
+        "plastic_state_variable_nodal": None,
+        "plastic_strain": _COMPONENTS_TENSOR,
+        "plastic_strain_nodal": _COMPONENTS_TENSOR,
+        "plastic_strain_elemental": _COMPONENTS_TENSOR,
+        "plastic_strain_principal": _COMPONENTS_PRINCIPAL,
+        "plastic_strain_principal_nodal": _COMPONENTS_PRINCIPAL,
+        "plastic_strain_principal_elemental": _COMPONENTS_PRINCIPAL,
+        "plastic_strain_eqv": None,
+        "plastic_strain_eqv_nodal": None,
+        "plastic_strain_eqv_elemental": None,
+    },
+)
+
+_set_result_docstrings(
+    ModalMechanicalSimulation,
+    {
+        "reaction_force": _COMPONENTS_VECTOR,
+        "elemental_volume": None,
+        "elemental_mass": None,
+        "element_centroids": None,
+        "thickness": None,
+        "element_orientations": None,
+        "element_orientations_elemental": None,
+        "element_orientations_nodal": None,
+        "hydrostatic_pressure": None,
+        "hydrostatic_pressure_nodal": None,
+        "hydrostatic_pressure_elemental": None,
+        "element_nodal_forces": _COMPONENTS_VECTOR,
+        "element_nodal_forces_nodal": _COMPONENTS_VECTOR,
+        "element_nodal_forces_elemental": _COMPONENTS_VECTOR,
+    },
+)
+
+# `nodal_force` and `nodal_moment` document `element_ids` as selecting the
+# nodes of the given elements.
+_set_result_docstrings(
+    ModalMechanicalSimulation,
+    {
+        "nodal_force": _COMPONENTS_VECTOR,
+        "nodal_moment": _COMPONENTS_VECTOR,
+    },
+    overrides={
+        "element_ids": """element_ids:
+    List of IDs of elements whose nodes to get results for.""",
+    },
+)
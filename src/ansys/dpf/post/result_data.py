@@ -123,6 +123,7 @@ class ResultData:
             time_scoping,
         )
         self._result_fields_container = None
+        self._min_max_operator = None
 
     def __str__(self):
         """Return the string representation of this class."""
@@ -223,12 +224,18 @@ class ResultData:
         return field.scoping.ids
 
     def _min_max(self, pin):
-        """Chain the operators to compute the minimum and maximum values."""
+        """Chain the operators to compute the minimum and maximum values.
+
+        The ``min_max_fc`` operator is instantiated once and shared by the
+        ``min``/``max`` accessors, so requesting both only runs the
+        reduction once.
+        """
         self._evaluate_result()
-        max_operator = Operator("min_max_fc")
-        max_operator.inputs.connect(self.result_fields_container)
-        result = max_operator.get_output(pin, types.field)
-        return result
+        if self._min_max_operator is None:
+            min_max_operator = Operator("min_max_fc")
+            min_max_operator.inputs.connect(self.result_fields_container)
+            self._min_max_operator = min_max_operator
+        return self._min_max_operator.get_output(pin, types.field)
 
     @property
     def max(self):
@@ -49,8 +49,17 @@ _component_label_to_index = {
     "XY": 3,
     "YZ": 4,
     "XZ": 5,
+    1: 0,
+    2: 1,
+    3: 2,
+    4: 3,
+    5: 4,
+    6: 5,
 }
 
+# String labels of the mapping, for error messages.
+_component_labels = [key for key in _component_label_to_index if isinstance(key, str)]
+
 _vector_component_names = ["X", "Y", "Z"]
 _matrix_component_names = ["XX", "YY", "ZZ", "XY", "YZ", "XZ"]
 _principal_names = ["1", "2", "3"]
@@ -79,19 +88,22 @@ def _build_components(base_name, components, component_names):
                 "Argument 'components' must be an int, a str, or a list of either."
             )
         for comp in components:
-            if not (isinstance(comp, str) or isinstance(comp, int)):
+            if not (isinstance(comp, str) or isinstance(comp, int)) or isinstance(
+                comp, bool
+            ):
                 raise ValueError(
                     "Argument 'components' can only contain integers and/or strings.\n"
                     f"The provided component '{comp}' is not valid."
                 )
-            if isinstance(comp, int):
-                comp = str(comp)
-            if comp not in _component_label_to_index.keys():
+            # Integer labels map directly: a single dict lookup normalizes the
+            # component without a string conversion.
+            index = _component_label_to_index.get(comp)
+            if index is None:
                 raise ValueError(
                     f"Component {comp} is not valid. Please use one of: "
-                    f"{list(_component_label_to_index.keys())}."
+                    f"{_component_labels}."
                 )
-            out.append(_component_label_to_index[comp])
+            out.append(index)
 
     # Take unique values and build names list
     if out is None:
@@ -44,9 +44,9 @@ def _connect_cyclic_inputs(expand_cyclic, phase_angle_cyclic, result_wf: Workflo
         if isinstance(expand_cyclic, list) and len(expand_cyclic) > 0:
             # If a list of sector numbers, directly connect it to the num_sectors pin
             if all(
-                [isinstance(expand_cyclic_i, int) for expand_cyclic_i in expand_cyclic]
+                isinstance(expand_cyclic_i, int) for expand_cyclic_i in expand_cyclic
             ):
-                if any([i < 1 for i in expand_cyclic]):
+                if any(i < 1 for i in expand_cyclic):
                     raise ValueError(
                         "Sector selection with 'expand_cyclic' starts at 1."
                     )
@@ -56,7 +56,7 @@ def _connect_cyclic_inputs(expand_cyclic, phase_angle_cyclic, result_wf: Workflo
                 )
             # If any is a list, treat it as per stage num_sectors
             elif any(
-                [isinstance(expand_cyclic_i, list) for expand_cyclic_i in expand_cyclic]
+                isinstance(expand_cyclic_i, list) for expand_cyclic_i in expand_cyclic
             ):
                 # Create a ScopingsContainer to fill
                 sectors_scopings = ScopingsContainer()
@@ -67,13 +67,15 @@ def _connect_cyclic_inputs(expand_cyclic, phase_angle_cyclic, result_wf: Workflo
                     if isinstance(num_sectors_stage_i, int):
                         num_sectors_stage_i = [num_sectors_stage_i]
                     elif isinstance(num_sectors_stage_i, list):
-                        if not all([isinstance(n, int) for n in num_sectors_stage_i]):
+                        if not all(
+                            isinstance(n, int) for n in num_sectors_stage_i
+                        ):
                             raise ValueError(
                                 "'expand_cyclic' only accepts lists of int values >= 1."
                             )
                     # num_sectors_stage_i is now a list of int,
                     # add an equivalent Scoping with the correct 'stage' label value
-                    if any([i < 1 for i in num_sectors_stage_i]):
+                    if any(i < 1 for i in num_sectors_stage_i):
                         raise ValueError(
                             "Sector selection with 'expand_cyclic' starts at 1."
                         )
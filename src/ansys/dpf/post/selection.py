@@ -89,6 +89,8 @@ class TimeFreqSelection:
     entities.
     """
 
+    __slots__ = ("_server", "_selection")
+
     def __init__(self, server: Union[BaseServer, None] = None):
         """Create a time/frequency selection.
 
@@ -234,6 +236,8 @@ class SpatialSelection:
     named selections...) into DPF known entities.
     """
 
+    __slots__ = ("_server", "_selection")
+
     def __init__(
         self,
         scoping: Union[Scoping, None] = None,
@@ -837,6 +841,13 @@ class Selection:
     The result domain defines the time/frequency and the spatial selection.
     """
 
+    __slots__ = (
+        "_server",
+        "_spatial_selection",
+        "_time_freq_selection",
+        "_qualifier_selection",
+    )
+
     def __init__(self, server: Union[BaseServer, None] = None):
         """Instantiate a Selection.
 
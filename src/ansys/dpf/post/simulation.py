@@ -27,6 +27,7 @@ Simulation
 
 """
 from abc import ABC
+import functools
 from os import PathLike
 import re
 from typing import Dict, List, Optional, Tuple, Union
@@ -58,9 +59,88 @@ from ansys.dpf.post.result_workflows._utils import _Rescoping
 from ansys.dpf.post.selection import Selection
 
 
+def _freeze_argument(value):
+    """Return a hashable version of a result extraction argument.
+
+    Lists are converted to tuples recursively and id arrays to their raw
+    bytes; any other value is returned unchanged.
+    """
+    if isinstance(value, list):
+        return tuple(_freeze_argument(item) for item in value)
+    if isinstance(value, np.ndarray):
+        return (value.dtype.str, value.tobytes())
+    return value
+
+
+# Leaf types allowed in a cache key: primitives compared by value. Anything
+# else (for example a Selection) hashes by object identity and can be mutated
+# in place, so keying a cache entry on it would serve stale results.
+_CACHE_KEY_TYPES = (str, bytes, int, float, bool, type(None))
+
+
+def _is_cache_safe(value):
+    """Whether a frozen argument may be used in a cache key.
+
+    True only if every leaf of the frozen value is a primitive compared by
+    value.
+    """
+    if isinstance(value, tuple):
+        return all(_is_cache_safe(item) for item in value)
+    return isinstance(value, _CACHE_KEY_TYPES)
+
+
+def _cache_result_method(fn):
+    """Cache the dataframes returned by a result extraction method.
+
+    The cache is stored on the simulation instance and keyed by the method
+    name and its keyword arguments (with lists frozen to tuples and id
+    arrays to their raw bytes). Calls with positional arguments, or with a
+    keyword value that does not freeze to primitives compared by value (for
+    example a ``Selection``, which hashes by identity and can be mutated in
+    place), bypass the cache entirely. The underlying result file does not
+    change over the lifetime of a simulation, so the entries that are cached
+    never go stale.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        if args:
+            return fn(self, *args, **kwargs)
+        frozen = [(name, _freeze_argument(value)) for name, value in kwargs.items()]
+        if not all(_is_cache_safe(value) for _, value in frozen):
+            return fn(self, **kwargs)
+        key = (fn.__name__,) + tuple(sorted(frozen))
+        cache = self._result_method_cache
+        cached = cache.get(key)
+        if cached is None:
+            cached = cache[key] = fn(self, **kwargs)
+        return cached
+
+    return wrapper
+
+
 class Simulation(ABC):
     """Base class of all PyDPF-Post simulation types."""
 
+    # Instance attributes are slotted: attribute accesses in the result
+    # extraction path skip the per-instance ``__dict__`` lookup and instances
+    # are cheaper. Subclasses with their own attributes must either extend
+    # ``__slots__`` or omit it to get a ``__dict__`` back.
+    __slots__ = (
+        "_model",
+        "_data_sources",
+        "_geometries",
+        "_boundary_conditions",
+        "_loads",
+        "_active_selection",
+        "_named_selections",
+        "_mesh",
+        "_units",
+        "_time_freq_precision",
+        "_first_mode_result_cache",
+        "_result_method_cache",
+    )
+
     def __init__(self, data_sources: DataSources, model: Model):
         """Initialize the simulation using a ``dpf.core.Model`` object."""
         self._model = model
@@ -73,11 +153,29 @@ class Simulation(ABC):
         self._mesh = None
         self._units = None
         self._time_freq_precision = None
+        # Cache of dataframes returned by the all-defaults result extraction
+        # calls, keyed by (base_name, location, category). The underlying
+        # result file does not change over the lifetime of the simulation.
+        self._first_mode_result_cache = {}
+        # Cache used by the _cache_result_method decorator, keyed by method
+        # name and frozen keyword arguments.
+        self._result_method_cache = {}
 
     def release_streams(self):
         """Release the streams to data files if any is active."""
         self._model.metadata.release_streams()
 
+    def clear_result_cache(self):
+        """Clear the cached dataframes of the result extraction methods.
+
+        Memoized extraction methods and the all-defaults fast path keep the
+        dataframes they return alive on the simulation. Call this method to
+        release that memory, for example after extracting large transient
+        results that are no longer needed.
+        """
+        self._first_mode_result_cache.clear()
+        self._result_method_cache.clear()
+
     @property
     def results(self) -> List[dpf.result_info.available_result.AvailableResult]:
         r"""Available results.
@@ -379,8 +477,11 @@ class Simulation(ABC):
         ...                 elemental_properties.element_shape: [0, 1]}
         ... )
         """
+        # Instantiate the mesh provider once: each Metadata.mesh_provider
+        # access builds a new operator.
+        mesh_output = self._model.metadata.mesh_provider.outputs.mesh
         split_op = dpf.operators.scoping.split_on_property_type(
-            mesh=self._model.metadata.mesh_provider.outputs.mesh,
+            mesh=mesh_output,
             requested_location=dpf.locations.elemental,
         )
         values = None
@@ -397,7 +498,7 @@ class Simulation(ABC):
         for i, scoping in enumerate(scopings_container):
             mesh_from_scoping = dpf.operators.mesh.from_scoping(
                 scoping=scoping,
-                mesh=self._model.metadata.mesh_provider.outputs.mesh,
+                mesh=mesh_output,
             )
             # meshes.append(mesh_from_scoping.outputs.mesh())
             meshes_container.add_mesh(
@@ -572,6 +673,8 @@ class MechanicalSimulation(Simulation, ABC):
     This class provides common methods and properties for all mechanical type simulations.
     """
 
+    __slots__ = ("_selection_cache",)
+
     def __init__(
         self,
         result_file: Union[PathLike, str, DataSources],
@@ -581,6 +684,11 @@ class MechanicalSimulation(Simulation, ABC):
         model = dpf.Model(result_file, server=server)
         data_sources = model.metadata.data_sources
         super().__init__(data_sources=data_sources, model=model)
+        # Cache of built (Selection, _Rescoping) pairs, keyed by the frozen
+        # _build_selection arguments. Building a selection costs one scoping
+        # workflow per call, which is redundant when several result types are
+        # extracted with an identical selection.
+        self._selection_cache = {}
 
     def _build_selection(
         self,
@@ -601,6 +709,72 @@ class MechanicalSimulation(Simulation, ABC):
         skin: Union[bool, List[int]] = False,
         expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
         average_per_body: Optional[bool] = False,
+    ) -> (Selection, Optional[_Rescoping]):
+        cache_key = None
+        if selection is None:
+            try:
+                cache_key = (
+                    base_name,
+                    category,
+                    _freeze_argument(set_ids),
+                    _freeze_argument(times),
+                    _freeze_argument(load_steps),
+                    all_sets,
+                    _freeze_argument(named_selections),
+                    _freeze_argument(element_ids),
+                    _freeze_argument(node_ids),
+                    location,
+                    _freeze_argument(external_layer),
+                    _freeze_argument(skin),
+                    _freeze_argument(expand_cyclic),
+                    average_per_body,
+                )
+                cached = self._selection_cache.get(cache_key)
+            except TypeError:
+                cache_key = None
+            else:
+                if cached is not None:
+                    return cached
+        built = self._build_selection_uncached(
+            base_name=base_name,
+            category=category,
+            selection=selection,
+            set_ids=set_ids,
+            times=times,
+            load_steps=load_steps,
+            all_sets=all_sets,
+            named_selections=named_selections,
+            element_ids=element_ids,
+            node_ids=node_ids,
+            location=location,
+            external_layer=external_layer,
+            skin=skin,
+            expand_cyclic=expand_cyclic,
+            average_per_body=average_per_body,
+        )
+        if cache_key is not None:
+            self._selection_cache[cache_key] = built
+        return built
+
+    def _build_selection_uncached(
+        self,
+        base_name: str,
+        category: ResultCategory,
+        selection: Union[Selection, None],
+        set_ids: Union[int, List[int], None],
+        times: Union[float, List[float], None],
+        load_steps: Union[
+            int, List[int], Tuple[int, Union[int, List[int]]], None
+        ] = None,
+        all_sets: bool = False,
+        named_selections: Union[List[str], str, None] = None,
+        element_ids: Union[List[int], None] = None,
+        node_ids: Union[List[int], None] = None,
+        location: Union[locations, str] = locations.nodal,
+        external_layer: bool = False,
+        skin: Union[bool, List[int]] = False,
+        expand_cyclic: Union[bool, List[Union[int, List[int]]]] = True,
+        average_per_body: Optional[bool] = False,
     ) -> (Selection, Optional[_Rescoping]):
         tot = (
             (node_ids is not None)
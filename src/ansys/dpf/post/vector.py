@@ -26,6 +26,22 @@ from ansys.dpf.core import Operator
 
 from ansys.dpf.post.result_object import Result
 
+# Description of the chained norm operator, shown in ResultData.__str__.
+_NORM_CHAIN_DOC = "This operator computes the norm of the result."
+
+
+def _append_norm(result_data):
+    # Chain a norm_fc operator after the result operator of result_data.
+    # The graph is only built here; it is evaluated once, when the data is
+    # first read.
+    norm_op = Operator("norm_fc")
+    norm_op.inputs.fields_container.connect(
+        result_data._evaluator._result_operator.outputs.fields_container
+    )
+    result_data._evaluator._result_operator = norm_op
+    result_data._evaluator._chained_operators[norm_op.name] = _NORM_CHAIN_DOC
+    return result_data
+
 
 class Vector(Result):
     """Implements the vector (displacement) result."""
@@ -64,14 +80,7 @@ class Vector(Result):
         result_data = super()._get_result_data(
             self._operator_name, self._data_sources, self._model
         )
-        out_op = result_data._evaluator._result_operator
-        norm_op = Operator("norm_fc")
-        norm_op.inputs.fields_container.connect(out_op.outputs.fields_container)
-        result_data._evaluator._result_operator = norm_op
-        result_data._evaluator._chained_operators[
-            norm_op.name
-        ] = """This operator computes the norm of the result."""
-        return result_data
+        return _append_norm(result_data)
 
     def __str__(self):
         """Return the string representation of this class."""
@@ -155,28 +164,14 @@ class ComplexVector(Vector):
         result_data = super()._get_result_data(
             self._operator_name, self._data_sources, self._model
         )
-        out_op = result_data._evaluator._result_operator
-        norm_op = Operator("norm_fc")
-        norm_op.inputs.fields_container.connect(out_op.outputs.fields_container)
-        result_data._evaluator._result_operator = norm_op
-        result_data._evaluator._chained_operators[
-            norm_op.name
-        ] = """This operator computes the norm of the result."""
-        return Result._get_amplitude_evaluation(self, result_data)
+        return Result._get_amplitude_evaluation(self, _append_norm(result_data))
 
     def norm_at_phase(self, phase: float):
         """Result data for the norm of the vector at a specific phase."""
         result_data = super()._get_result_data(
             self._operator_name, self._data_sources, self._model, phase=phase
         )
-        out_op = result_data._evaluator._result_operator
-        norm_op = Operator("norm_fc")
-        norm_op.inputs.fields_container.connect(out_op.outputs.fields_container)
-        result_data._evaluator._result_operator = norm_op
-        result_data._evaluator._chained_operators[
-            norm_op.name
-        ] = """This operator computes the norm of the result."""
-        return result_data
+        return _append_norm(result_data)
 
     def __str__(self):
         """Return the string representation of this class."""
@@ -398,29 +398,29 @@ def test_dataframe_min_max():
     df = simulation.displacement(all_sets=True)
     # Over the mesh entities
     min_over_mesh = [[-0.00074732, -0.00040138, -0.00021555]]
-    assert np.all(np.isclose(df.min()._fc[0].data.tolist(), min_over_mesh))
-    assert np.all(np.isclose(df.min(axis=0)._fc[0].data.tolist(), min_over_mesh))
+    assert np.all(np.isclose(df.min()._fc[0].data, min_over_mesh))
+    assert np.all(np.isclose(df.min(axis=0)._fc[0].data, min_over_mesh))
     assert np.all(
-        np.isclose(df.min(axis="node_ids")._fc[0].data.tolist(), min_over_mesh)
+        np.isclose(df.min(axis="node_ids")._fc[0].data, min_over_mesh)
     )
 
     max_over_mesh = [[0.00073303, 0.00139618, 0.00021567]]
-    assert np.all(np.isclose(df.max()._fc[0].data.tolist(), max_over_mesh))
-    assert np.all(np.isclose(df.max(axis=0)._fc[0].data.tolist(), max_over_mesh))
+    assert np.all(np.isclose(df.max()._fc[0].data, max_over_mesh))
+    assert np.all(np.isclose(df.max(axis=0)._fc[0].data, max_over_mesh))
     assert np.all(
-        np.isclose(df.max(axis="node_ids")._fc[0].data.tolist(), max_over_mesh)
+        np.isclose(df.max(axis="node_ids")._fc[0].data, max_over_mesh)
     )
 
     # Over the SetIndex
     min_over_time = [-3.41368775e-05, 5.16665595e-04, -4.13456506e-06]
-    assert np.all(np.isclose(df.min(axis=1)._fc[0].data[0].tolist(), min_over_time))
+    assert np.all(np.isclose(df.min(axis=1)._fc[0].data[0], min_over_time))
     assert np.all(
-        np.isclose(df.min(axis="set_ids")._fc[0].data[0].tolist(), min_over_time)
+        np.isclose(df.min(axis="set_ids")._fc[0].data[0], min_over_time)
     )
     max_over_time = [5.67807472e-06, 1.54174694e-03, -2.63976203e-06]
-    assert np.all(np.isclose(df.max(axis=1)._fc[0].data[0].tolist(), max_over_time))
+    assert np.all(np.isclose(df.max(axis=1)._fc[0].data[0], max_over_time))
     assert np.all(
-        np.isclose(df.max(axis="set_ids")._fc[0].data[0].tolist(), max_over_time)
+        np.isclose(df.max(axis="set_ids")._fc[0].data[0], max_over_time)
     )
 
     # Raise unrecognized axis
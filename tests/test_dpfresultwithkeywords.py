@@ -326,7 +326,7 @@ def test_groupingelshape_nodallocation(allkindofcomplexity):
     assert len(fc) == disp.num_fields
     assert fc[0].location == disp[0].location
     assert len(fc[0].data) == len(disp[0].data)
-    assert np.allclose(disp[0].data.tolist(), fc[0].data.tolist())
+    assert np.allclose(disp[0].data, fc[0].data)
     comp = core.operators.logic.identical_fc()
     comp.inputs.fields_containerA.connect(fc)
     comp.inputs.fields_containerB.connect(disp.result_fields_container)
@@ -385,7 +385,7 @@ def test_groupingelshape_elemlocation(allkindofcomplexity):
     assert len(fc) == stress.num_fields
     assert fc[0].location == stress[0].location
     assert len(fc[0].data) == len(stress[0].data)
-    assert np.allclose(stress[0].data.tolist(), fc[0].data.tolist())
+    assert np.allclose(stress[0].data, fc[0].data)
     comp = core.operators.logic.identical_fc()
     comp.inputs.fields_containerA.connect(fc)
     comp.inputs.fields_containerB.connect(stress.result_fields_container)
@@ -442,7 +442,7 @@ def test_groupingmat_nodallocation(allkindofcomplexity):
     assert len(fc) == disp.num_fields
     assert fc[0].location == disp[0].location
     assert len(fc[0].data) == len(disp[0].data)
-    assert np.allclose(disp[0].data.tolist(), fc[0].data.tolist())
+    assert np.allclose(disp[0].data, fc[0].data)
     comp = core.operators.logic.identical_fc()
     comp.inputs.fields_containerA.connect(fc)
     comp.inputs.fields_containerB.connect(disp.result_fields_container)
@@ -491,7 +491,7 @@ def test_groupingmat_elemlocation(allkindofcomplexity):
     assert len(fc) == stress.num_fields
     assert fc[0].location == stress[0].location
     assert len(fc[0].data) == len(stress[0].data)
-    assert np.allclose(stress[0].data.tolist(), fc[0].data.tolist())
+    assert np.allclose(stress[0].data, fc[0].data)
     comp = core.operators.logic.identical_fc()
     comp.inputs.fields_containerA.connect(fc)
     comp.inputs.fields_containerB.connect(stress.result_fields_container)
@@ -25,12 +25,19 @@ import pytest
 
 from ansys.dpf import post
 from ansys.dpf.post import errors as dpf_errors
+from ansys.dpf.post import examples
 from ansys.dpf.post.common import _PhysicsType
 from ansys.dpf.post.electric_results import ElectricField, ElectricPotential
 
 
-def test_electricfield(rth_electric):
-    solution = post.load_solution(rth_electric)
+@pytest.fixture(scope="module")
+def electric_solution():
+    """Load the electric-thermal solution once for the whole module."""
+    return post.load_solution(examples.electric_therm)
+
+
+def test_electricfield(electric_solution, rth_electric):
+    solution = electric_solution
     assert solution._model.metadata.result_info.physics_type == _PhysicsType.thermal
     ef = solution.electric_field()
     assert isinstance(ef, ElectricField)
@@ -50,11 +57,11 @@ def test_electricfield(rth_electric):
     assert len(fc) == s.num_fields
     assert fc[0].location == s[0].location
     assert len(fc[0].data[20]) == len(s[0].data[20])
-    assert np.allclose(s[0].data.tolist(), fc[0].data.tolist())
+    assert np.allclose(s[0].data, fc[0].data)
 
 
-def test_electricfield_nodscoping(rth_electric):
-    solution = post.load_solution(rth_electric)
+def test_electricfield_nodscoping(electric_solution):
+    solution = electric_solution
     ef = solution.electric_field(node_scoping=[2])
     s = ef.vector
     assert s.num_fields == 1
@@ -62,7 +69,7 @@ def test_electricfield_nodscoping(rth_electric):
     assert len(s[0].data) == 1
     assert len(s[0].data[0]) == 3
     assert np.allclose(
-        s[0].data[0].tolist(), [5.25223311e-14, 1.95629520e01, 2.82945325e-14]
+        s[0].data[0], [5.25223311e-14, 1.95629520e01, 2.82945325e-14]
     )
     ef = solution.electric_field(location=post.locations.elemental, node_scoping=[2])
     s = ef.vector
@@ -71,7 +78,7 @@ def test_electricfield_nodscoping(rth_electric):
     assert len(s[0].data) == 8
     assert len(s[0].data[0]) == 3
     assert np.allclose(
-        s[0].data[0].tolist(), [-3.41948692e-14, 1.95629520e01, 7.77156117e-15]
+        s[0].data[0], [-3.41948692e-14, 1.95629520e01, 7.77156117e-15]
     )
     ef = solution.electric_field(
         location=post.locations.elemental_nodal, node_scoping=[2]
@@ -83,13 +90,13 @@ def test_electricfield_nodscoping(rth_electric):
         assert len(s[0].data) == 8
         assert len(s[0].data[0]) == 3
         assert np.allclose(
-            s[0].data.tolist(), [2.63128894e-11, 1.95629520e01, 2.62733394e-11]
+            s[0].data, [2.63128894e-11, 1.95629520e01, 2.62733394e-11]
         )
     else:
         assert len(s[0].data) == 64
         assert len(s[0].data[0]) == 3
         assert np.allclose(
-            s[0].data.tolist(), [2.63128894e-11, 1.95629520e01, 2.62733394e-11]
+            s[0].data, [2.63128894e-11, 1.95629520e01, 2.62733394e-11]
         )
 
 
@@ -123,32 +130,32 @@ def test_electricfield_elemscoping(rth_electric):
     # assert np.isclose(s[0].data.tolist(), [-3.41948692e-14,  1.95629520e+01,  7.77156117e-15])
 
 
-def test_electricfield_nodlocation(rth_electric):
-    solution = post.load_solution(rth_electric)
+def test_electricfield_nodlocation(electric_solution):
+    solution = electric_solution
     ef = solution.electric_field()
     s = ef.vector
     assert s.num_fields == 1
     assert s[0].location == post.locations.nodal
 
 
-def test_electricfield_elemlocation(rth_electric):
-    solution = post.load_solution(rth_electric)
+def test_electricfield_elemlocation(electric_solution):
+    solution = electric_solution
     ef = solution.electric_field(location=post.locations.elemental)
     s = ef.vector
     assert s.num_fields == 1
     assert s[0].location == post.locations.elemental
 
 
-def test_electricfield_elemnodlocation(rth_electric):
-    solution = post.load_solution(rth_electric)
+def test_electricfield_elemnodlocation(electric_solution):
+    solution = electric_solution
     ef = solution.electric_field(location=post.locations.elemental_nodal)
     s = ef.vector
     assert s.num_fields == 1
     assert s[0].location == post.locations.elemental_nodal
 
 
-def test_electricfield_timescoping(rth_electric):
-    solution = post.load_solution(rth_electric)
+def test_electricfield_timescoping(electric_solution):
+    solution = electric_solution
     ef = solution.electric_field(time_scoping=1)
     s = ef.vector
     assert s.num_fields == 1
@@ -157,8 +164,8 @@ def test_electricfield_timescoping(rth_electric):
     assert np.isclose(s[0].data[23][1], 19.562952041625977)
 
 
-def test_electricfield_time(rth_electric):
-    solution = post.load_solution(rth_electric)
+def test_electricfield_time(electric_solution):
+    solution = electric_solution
     ef = solution.electric_field(time=1.0)
     s = ef.vector
     assert s.num_fields == 1
@@ -167,8 +174,8 @@ def test_electricfield_time(rth_electric):
     assert np.isclose(s[0].data[23][1], 19.562952041625977)
 
 
-def test_electricfield_set(rth_electric):
-    solution = post.load_solution(rth_electric)
+def test_electricfield_set(electric_solution):
+    solution = electric_solution
     ef = solution.electric_field(set=1)
     s = ef.vector
     assert s.num_fields == 1
@@ -177,8 +184,8 @@ def test_electricfield_set(rth_electric):
     assert np.isclose(s[0].data[23][1], 19.562952041625977)
 
 
-def test_electricpotential(rth_electric):
-    solution = post.load_solution(rth_electric)
+def test_electricpotential(electric_solution, rth_electric):
+    solution = electric_solution
     assert solution._model.metadata.result_info.physics_type == _PhysicsType.thermal
     ef = solution.electric_potential()
     assert isinstance(ef, ElectricPotential)
@@ -198,7 +205,7 @@ def test_electricpotential(rth_electric):
     assert len(fc) == s.num_fields
     assert fc[0].location == s[0].location
     assert len(fc[0].data) == len(s[0].data)
-    assert np.allclose(s[0].data.tolist(), fc[0].data.tolist())
+    assert np.allclose(s[0].data, fc[0].data)
     comp = core.operators.logic.identical_fc()
     comp.inputs.fields_containerA.connect(fc)
     comp.inputs.fields_containerB.connect(s.result_fields_container)
@@ -209,8 +216,8 @@ def test_electricpotential(rth_electric):
 to_return = "node scoping and element scoping returns the same"
 
 
-def test_electricpotential_nodscoping(rth_electric):
-    solution = post.load_solution(rth_electric)
+def test_electricpotential_nodscoping(electric_solution):
+    solution = electric_solution
     ef = solution.electric_potential(node_scoping=[2])
     s = ef.scalar
     assert s.num_fields == 1
@@ -222,8 +229,8 @@ def test_electricpotential_nodscoping(rth_electric):
 @pytest.mark.skipif(
     True, reason="element scoping not available with electrical results."
 )
-def test_electricpotential_elemscoping(rth_electric):
-    solution = post.load_solution(rth_electric)
+def test_electricpotential_elemscoping(electric_solution):
+    solution = electric_solution
     ef = solution.electric_potential(node_scoping=[2])
     s = ef.scalar
     assert s.num_fields == 1
@@ -233,28 +240,28 @@ def test_electricpotential_elemscoping(rth_electric):
     raise Exception(to_return)
 
 
-def test_electricpotential_nodlocation(rth_electric):
-    solution = post.load_solution(rth_electric)
+def test_electricpotential_nodlocation(electric_solution):
+    solution = electric_solution
     ef = solution.electric_potential(location=post.locations.nodal)
     s = ef.scalar
     assert s.num_fields == 1
     assert s[0].location == post.locations.nodal
 
 
-def test_electricpotential_elemlocation(rth_electric):
-    solution = post.load_solution(rth_electric)
+def test_electricpotential_elemlocation(electric_solution):
+    solution = electric_solution
     with pytest.raises(dpf_errors.NodalLocationError):
         solution.electric_potential(location=post.locations.elemental)
 
 
-def test_electricpotential_elemnodallocation(rth_electric):
-    solution = post.load_solution(rth_electric)
+def test_electricpotential_elemnodallocation(electric_solution):
+    solution = electric_solution
     with pytest.raises(dpf_errors.NodalLocationError):
         solution.electric_potential(location=post.locations.elemental_nodal)
 
 
-def test_electricpotential_timescoping(rth_electric):
-    solution = post.load_solution(rth_electric)
+def test_electricpotential_timescoping(electric_solution):
+    solution = electric_solution
     ef = solution.electric_potential(time_scoping=[1])
     s = ef.scalar
     assert s.num_fields == 1
@@ -263,8 +270,8 @@ def test_electricpotential_timescoping(rth_electric):
     assert np.isclose(s[0].data[0], 0.07336107005500624)
 
 
-def test_electricpotential_time(rth_electric):
-    solution = post.load_solution(rth_electric)
+def test_electricpotential_time(electric_solution):
+    solution = electric_solution
     ef = solution.electric_potential(set=1)
     s = ef.scalar
     assert s.num_fields == 1
@@ -273,8 +280,8 @@ def test_electricpotential_time(rth_electric):
     assert np.isclose(s[0].data[0], 0.07336107005500624)
 
 
-def test_electricpotential_set(rth_electric):
-    solution = post.load_solution(rth_electric)
+def test_electricpotential_set(electric_solution):
+    solution = electric_solution
     ef = solution.electric_potential(time=1.0)
     s = ef.scalar
     assert s.num_fields == 1
@@ -29,6 +29,7 @@ import pytest
 
 from ansys import dpf
 from ansys.dpf import post
+from ansys.dpf.post import examples
 import ansys.dpf.post.errors
 from ansys.dpf.post.result_data import ResultData
 
@@ -36,31 +37,52 @@ from ansys.dpf.post.result_data import ResultData
 RUNNING_DOCKER = os.environ.get("DPF_DOCKER", False)
 
 
-def test_num_fields_verbose_api(allkindofcomplexity):
-    result = post.load_solution(allkindofcomplexity)
+def _extrude_path(start, n_points, step):
+    """Return an ``(n_points, 3)`` path: ``start`` extruded by multiples of ``step``.
+
+    Canonical way to build regular paths for ``create_path_on_coordinates``
+    without looping in Python over the points.
+    """
+    return np.asarray(start) + np.arange(n_points).reshape(-1, 1) * np.asarray(step)
+
+
+@pytest.fixture(scope="module")
+def allkindofcomplexity_solution():
+    """Load the "allKindOfComplexity" solution once for the whole module."""
+    return post.load_solution(examples.download_all_kinds_of_complexity())
+
+
+@pytest.fixture(scope="module")
+def plate_msup_solution():
+    """Load the "msup/plate1" transient solution once for the whole module."""
+    return post.load_solution(examples.msup_transient)
+
+
+def test_num_fields_verbose_api(allkindofcomplexity_solution):
+    result = allkindofcomplexity_solution
     disp = result.misc.nodal_displacement()
     assert isinstance(disp, ResultData)
     assert disp.num_fields == 1
 
 
-def test_num_fields(allkindofcomplexity):
-    result = post.load_solution(allkindofcomplexity)
+def test_num_fields(allkindofcomplexity_solution):
+    result = allkindofcomplexity_solution
     d = result.displacement()
     disp = d.vector
     assert isinstance(disp, ResultData)
     assert disp.num_fields == 1
 
 
-def test_data_at_field_verbose_api(allkindofcomplexity):
-    result = post.load_solution(allkindofcomplexity)
+def test_data_at_field_verbose_api(allkindofcomplexity_solution):
+    result = allkindofcomplexity_solution
     disp = result.misc.nodal_displacement()
     data = disp.get_data_at_field(0)
     assert len(data) == 15113
     assert len(data[0]) == 3
 
 
-def test_data_at_field(allkindofcomplexity):
-    result = post.load_solution(allkindofcomplexity)
+def test_data_at_field(allkindofcomplexity_solution):
+    result = allkindofcomplexity_solution
     d = result.displacement()
     disp = d.vector
     data = disp.get_data_at_field(0)
@@ -68,16 +90,16 @@ def test_data_at_field(allkindofcomplexity):
     assert len(data[0]) == 3
 
 
-def test_field_getitem_verbose_api(allkindofcomplexity):
-    result = post.load_solution(allkindofcomplexity)
+def test_field_getitem_verbose_api(allkindofcomplexity_solution):
+    result = allkindofcomplexity_solution
     disp = result.misc.nodal_displacement()
     field = disp[0]
     assert isinstance(field, dpf.core.Field)
     assert field.location == locations.nodal
 
 
-def test_field_getitem(allkindofcomplexity):
-    result = post.load_solution(allkindofcomplexity)
+def test_field_getitem(allkindofcomplexity_solution):
+    result = allkindofcomplexity_solution
     d = result.displacement()
     disp = d.vector
     field = disp[0]
@@ -85,8 +107,8 @@ def test_field_getitem(allkindofcomplexity):
     assert field.location == locations.nodal
 
 
-def test_max_verbose_api(allkindofcomplexity):
-    result = post.load_solution(allkindofcomplexity)
+def test_max_verbose_api(allkindofcomplexity_solution):
+    result = allkindofcomplexity_solution
     disp = result.misc.nodal_displacement()
     max_val = disp.max
     assert len(max_val) == 3
@@ -94,8 +116,8 @@ def test_max_verbose_api(allkindofcomplexity):
     assert len(max_val.data[0]) == 3
 
 
-def test_max(allkindofcomplexity):
-    result = post.load_solution(allkindofcomplexity)
+def test_max(allkindofcomplexity_solution):
+    result = allkindofcomplexity_solution
     d = result.displacement()
     disp = d.vector
     max_val = disp.max
@@ -104,8 +126,8 @@ def test_max(allkindofcomplexity):
     assert len(max_val.data[0]) == 3
 
 
-def test_min_verbose_api(allkindofcomplexity):
-    result = post.load_solution(allkindofcomplexity)
+def test_min_verbose_api(allkindofcomplexity_solution):
+    result = allkindofcomplexity_solution
     disp = result.misc.nodal_displacement()
     min_val = disp.min
     assert len(min_val) == 3
@@ -113,8 +135,8 @@ def test_min_verbose_api(allkindofcomplexity):
     assert len(min_val.data[0]) == 3
 
 
-def test_min(allkindofcomplexity):
-    result = post.load_solution(allkindofcomplexity)
+def test_min(allkindofcomplexity_solution):
+    result = allkindofcomplexity_solution
     d = result.displacement()
     disp = d.vector
     min_val = disp.min
@@ -123,16 +145,16 @@ def test_min(allkindofcomplexity):
     assert len(min_val.data[0]) == 3
 
 
-def test_maxdata_verbose_api(allkindofcomplexity):
-    result = post.load_solution(allkindofcomplexity)
+def test_maxdata_verbose_api(allkindofcomplexity_solution):
+    result = allkindofcomplexity_solution
     disp = result.misc.nodal_displacement()
     val = disp.max_data
     assert len(val) == 1
     assert len(val[0]) == 3
 
 
-def test_maxdata(allkindofcomplexity):
-    result = post.load_solution(allkindofcomplexity)
+def test_maxdata(allkindofcomplexity_solution):
+    result = allkindofcomplexity_solution
     d = result.displacement()
     disp = d.vector
     val = disp.max_data
@@ -140,16 +162,16 @@ def test_maxdata(allkindofcomplexity):
     assert len(val[0]) == 3
 
 
-def test_mindata_verbose_api(allkindofcomplexity):
-    result = post.load_solution(allkindofcomplexity)
+def test_mindata_verbose_api(allkindofcomplexity_solution):
+    result = allkindofcomplexity_solution
     disp = result.misc.nodal_displacement()
     val = disp.min_data
     assert len(val) == 1
     assert len(val[0]) == 3
 
 
-def test_mindata(allkindofcomplexity):
-    result = post.load_solution(allkindofcomplexity)
+def test_mindata(allkindofcomplexity_solution):
+    result = allkindofcomplexity_solution
     d = result.displacement()
     disp = d.vector
     val = disp.min_data
@@ -157,30 +179,30 @@ def test_mindata(allkindofcomplexity):
     assert len(val[0]) == 3
 
 
-def test_maxdata_at_field_verbose_api(allkindofcomplexity):
-    result = post.load_solution(allkindofcomplexity)
+def test_maxdata_at_field_verbose_api(allkindofcomplexity_solution):
+    result = allkindofcomplexity_solution
     disp = result.misc.nodal_displacement()
     val = disp.get_max_data_at_field(0)
     assert len(val) == 3
 
 
-def test_maxdata_at_field(allkindofcomplexity):
-    result = post.load_solution(allkindofcomplexity)
+def test_maxdata_at_field(allkindofcomplexity_solution):
+    result = allkindofcomplexity_solution
     d = result.displacement()
     disp = d.vector
     val = disp.get_max_data_at_field(0)
     assert len(val) == 3
 
 
-def test_min_data_at_field_verbose_api(allkindofcomplexity):
-    result = post.load_solution(allkindofcomplexity)
+def test_min_data_at_field_verbose_api(allkindofcomplexity_solution):
+    result = allkindofcomplexity_solution
     disp = result.misc.nodal_displacement()
     val = disp.get_min_data_at_field(0)
     assert len(val) == 3
 
 
-def test_min_data_at_field(allkindofcomplexity):
-    result = post.load_solution(allkindofcomplexity)
+def test_min_data_at_field(allkindofcomplexity_solution):
+    result = allkindofcomplexity_solution
     d = result.displacement()
     disp = d.vector
     val = disp.get_min_data_at_field(0)
@@ -208,8 +230,8 @@ def test_get_all_labels(modalallkindofcomplexity):
     assert "time" in l_comp[0].keys()
 
 
-def test_get_scoping_at_field_verbose_api(plate_msup):
-    result = post.load_solution(plate_msup)
+def test_get_scoping_at_field_verbose_api(plate_msup_solution):
+    result = plate_msup_solution
     disp = result.misc.nodal_displacement(time_scoping=[1, 2, 4])
     assert disp.num_fields == 3
     scop = disp.get_scoping_at_field(2)
@@ -217,8 +239,8 @@ def test_get_scoping_at_field_verbose_api(plate_msup):
     assert scop[2] == 95
 
 
-def test_get_scoping_at_field(plate_msup):
-    result = post.load_solution(plate_msup)
+def test_get_scoping_at_field(plate_msup_solution):
+    result = plate_msup_solution
     d = result.displacement(time_scoping=[1, 2, 4])
     disp = d.vector
     assert disp.num_fields == 3
@@ -227,8 +249,8 @@ def test_get_scoping_at_field(plate_msup):
     assert scop[2] == 95
 
 
-def test_print(plate_msup):
-    result = post.load_solution(plate_msup)
+def test_print(plate_msup_solution):
+    result = plate_msup_solution
     # print(result)
     str(result)
     d = result.displacement(time_scoping=[1, 2, 4])
@@ -239,41 +261,41 @@ def test_print(plate_msup):
     str(disp)
 
 
-def test_plot_chart(plate_msup):
-    transient_sol = post.load_solution(plate_msup)
+def test_plot_chart(plate_msup_solution):
+    transient_sol = plate_msup_solution
     disp = transient_sol.displacement(time_scoping=list(range(1, 21)))
     vector = disp.vector
     vector.num_fields
     vector._plot_chart()
 
 
-def test_plot_contour_one_field(plate_msup):
-    solution = post.load_solution(plate_msup)
+def test_plot_contour_one_field(plate_msup_solution):
+    solution = plate_msup_solution
     stress = solution.stress(location=post.locations.elemental, time_scoping=[1])
     s = stress.tensor
     s.plot_contour("time", 1)
     s.plot_contour()
 
 
-def test_plot_contour_wrong_label(allkindofcomplexity):
-    solution = post.load_solution(allkindofcomplexity)
+def test_plot_contour_wrong_label(allkindofcomplexity_solution):
+    solution = allkindofcomplexity_solution
     stress = solution.stress(location=post.locations.elemental, time_scoping=[1])
     s = stress.tensor
     with pytest.raises(ansys.dpf.post.errors.LabelSpaceError):
         s.plot_contour("egg", 30)
 
 
-def test_plot_contour_two_fields(allkindofcomplexity):
+def test_plot_contour_two_fields(allkindofcomplexity_solution):
     # split shell/solid
-    solution = post.load_solution(allkindofcomplexity)
+    solution = allkindofcomplexity_solution
     stress = solution.stress(location=post.locations.elemental, time_scoping=[1])
     s = stress.tensor
     s.plot_contour("time", 1)
     s.plot_contour()
 
 
-def test_plot_contour_with_keys(allkindofcomplexity):
-    result = post.load_solution(allkindofcomplexity)
+def test_plot_contour_with_keys(allkindofcomplexity_solution):
+    result = allkindofcomplexity_solution
     d = result.displacement(grouping=post.grouping.by_el_shape)
     disp = d.vector
     disp.plot_contour("elshape", 1)
@@ -296,8 +318,8 @@ def test_plot_contour_with_keys(allkindofcomplexity):
 
 
 @pytest.mark.skipif(RUNNING_DOCKER, reason="Path hidden within docker container")
-def test_plot_with_vtk_file(allkindofcomplexity):
-    solution = post.load_solution(allkindofcomplexity)
+def test_plot_with_vtk_file(allkindofcomplexity_solution):
+    solution = allkindofcomplexity_solution
     stress = solution.stress(location=post.locations.elemental, time_scoping=[1])
     s = stress.tensor
     s._plot_contour_with_vtk_file()
@@ -314,41 +336,19 @@ MEETS_CORE_034 = core.check_version.meets_version(version_core, "0.3.4")
     reason="Plot path on coordinates" "available from dpf-core 0.3.4.",
 )
 def test_plot_on_coordinates(model_ns):
-    coordinates = [[-0.0195, 0.006, -0.0025]]
-    for i in range(1, 101):
-        coord_copy = []
-        coord_copy.append(coordinates[0][0])
-        coord_copy.append(coordinates[0][1])
-        coord_copy.append(coordinates[0][2])
-        coord_copy[0] = coord_copy[0] + i * 0.0003
-        coordinates.append(coord_copy)
-    ref = [-0.0155, 0.00600634, -0.0025]
-    coordinates.append(ref)
-    for i in range(1, 101):
-        coord_copy = []
-        coord_copy.append(ref[0])
-        coord_copy.append(ref[1])
-        coord_copy.append(ref[2])
-        coord_copy[0] = coord_copy[0] + i * 0.0003
-        coordinates.append(coord_copy)
-    ref = [-0.0125, 0.00600507, -0.0025]
-    coordinates.append(ref)
-    for i in range(1, 101):
-        coord_copy = []
-        coord_copy.append(ref[0])
-        coord_copy.append(ref[1])
-        coord_copy.append(ref[2])
-        coord_copy[0] = coord_copy[0] + i * 0.0003
-        coordinates.append(coord_copy)
-    ref = [-0.0125, 0.00600444, -0.0025]
-    coordinates.append(ref)
-    for i in range(1, 101):
-        coord_copy = []
-        coord_copy.append(ref[0])
-        coord_copy.append(ref[1])
-        coord_copy.append(ref[2])
-        coord_copy[0] = coord_copy[0] + i * 0.0003
-        coordinates.append(coord_copy)
+    # Four segments of 101 points each, extruded along x from their start
+    # point by steps of 0.0003.
+    starts = np.array(
+        [
+            [-0.0195, 0.006, -0.0025],
+            [-0.0155, 0.00600634, -0.0025],
+            [-0.0125, 0.00600507, -0.0025],
+            [-0.0125, 0.00600444, -0.0025],
+        ]
+    )
+    coordinates = np.concatenate(
+        [_extrude_path(start, 101, [0.0003, 0.0, 0.0]) for start in starts]
+    )
     solution = post.load_solution(model_ns)
     path = post.create_path_on_coordinates(coordinates=coordinates)
     displacement = solution.displacement(path=path)
@@ -358,13 +358,9 @@ def test_plot_on_coordinates(model_ns):
 @pytest.mark.skipif(
     not MEETS_CORE_034, reason="Path on coordinates" "available from dpf-core 0.3.4."
 )
-def test_plot_on_coordinates_msup_transient(plate_msup):
-    coordinates = [[0.075, 0.005, 0.975]]
-    for i in range(1, 20):
-        coord_copy = coordinates[0].copy()
-        coord_copy[2] = coord_copy[2] - i * 0.05
-        coordinates.append(coord_copy)
-    solution = post.load_solution(plate_msup)
+def test_plot_on_coordinates_msup_transient(plate_msup_solution):
+    coordinates = _extrude_path([0.075, 0.005, 0.975], 20, [0.0, 0.0, -0.05])
+    solution = plate_msup_solution
     path = post.create_path_on_coordinates(coordinates=coordinates)
     stress = solution.stress(path=path)
     sxx = stress.xx
@@ -375,33 +371,27 @@ def test_plot_on_coordinates_msup_transient(plate_msup):
     not MEETS_CORE_034, reason="Path on coordinates" "available from dpf-core 0.3.4."
 )
 def test_plot_on_coordinates_complex_rst(complex_model):
-    coordinates = [[-0.00499615, 0.000196299, 0.0001]]
-    for i in range(1, 20):
-        coord_copy = coordinates[0].copy()
-        coord_copy[0] = coord_copy[0] + i * 0.00024981
-        coordinates.append(coord_copy)
+    coordinates = _extrude_path(
+        [-0.00499615, 0.000196299, 0.0001], 20, [0.00024981, 0.0, 0.0]
+    )
     solution = post.load_solution(complex_model)
     path = post.create_path_on_coordinates(coordinates=coordinates)
     stress = solution.stress(path=path)
     sxx = stress.xx_amplitude
     sxx.plot_contour()
 
-    coordinates = [[-0.00499615, 0.000196299, 0.0001]]
-    for i in range(1, 40):
-        coord_copy = coordinates[0].copy()
-        coord_copy[0] = coord_copy[0] + i * 0.00024981
-        coordinates.append(coord_copy)
+    coordinates = _extrude_path(
+        [-0.00499615, 0.000196299, 0.0001], 40, [0.00024981, 0.0, 0.0]
+    )
     solution = post.load_solution(complex_model)
     path = post.create_path_on_coordinates(coordinates=coordinates)
     stress = solution.stress(path=path)
     vm = stress.von_mises_amplitude
     vm.plot_contour(off_screen=True)
 
-    coordinates = [[-0.00499615, 0.000196299, 0.0001]]
-    for i in range(1, 40):
-        coord_copy = coordinates[0].copy()
-        coord_copy[0] = coord_copy[0] + i * 0.00024981
-        coordinates.append(coord_copy)
+    coordinates = _extrude_path(
+        [-0.00499615, 0.000196299, 0.0001], 40, [0.00024981, 0.0, 0.0]
+    )
     solution = post.load_solution(complex_model)
     path = post.create_path_on_coordinates(coordinates=coordinates)
     d = solution.displacement(path=path)
@@ -420,12 +410,11 @@ def test_path_on_coordinates_with_different_type_of_arrays(static_rst):
         [1.27369182e-09, -6.50860213e-09, -1.73204664e-09],
     ]
     # set up
-    coordinates = [[0.024, 0.03, 0.003]]
-    for i in range(1, 3):
-        coord_copy = coordinates[0].copy()
-        coord_copy[1] = coord_copy[0] + i * 0.01
-        coordinates.append(coord_copy)
-
+    coordinates = [
+        [0.024, 0.03, 0.003],
+        [0.024, 0.034, 0.003],
+        [0.024, 0.044, 0.003],
+    ]
     solution = post.load_solution(static_rst)
     # case with array as a list[list[int]]
     # ================================
@@ -479,11 +468,13 @@ def test_path_on_coordinates_with_field(static_rst):
         [1.27369182e-09, -6.50860213e-09, -1.73204664e-09],
     ]
     # set up
-    coordinates = [[0.024, 0.03, 0.003]]
-    for i in range(1, 3):
-        coord_copy = coordinates[0].copy()
-        coord_copy[1] = coord_copy[0] + i * 0.01
-        coordinates.append(coord_copy)
+    coordinates = np.array(
+        [
+            [0.024, 0.03, 0.003],
+            [0.024, 0.034, 0.003],
+            [0.024, 0.044, 0.003],
+        ]
+    )
     solution = post.load_solution(static_rst)
     scoping_ids_orig = [14, 5, 101]
     # case with scoping as list of int
@@ -499,8 +490,5 @@ def test_path_on_coordinates_with_field(static_rst):
     assert len(field) == 9  # 3 notes * 3 dofs
     assert len(field.scoping) == 3
     scoping_ids = field.scoping.ids
-    result = np.array_equal(
-        np.array(scoping_ids).sort(), np.array(scoping_ids_orig).sort()
-    )
-    assert result is True
+    assert np.array_equal(np.sort(scoping_ids), np.sort(scoping_ids_orig))
     assert np.allclose(field.data, ref, rtol=1.0e-20)
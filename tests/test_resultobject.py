@@ -391,7 +391,7 @@ def test_displacement(allkindofcomplexity):
     assert len(fc) == value.num_fields
     assert fc[0].location == value[0].location
     assert len(fc[0].data) == len(value[0].data)
-    assert np.allclose(value[0].data.tolist(), fc[0].data.tolist())
+    assert np.allclose(value[0].data, fc[0].data)
     comp = core.operators.logic.identical_fc()
     comp.inputs.fields_containerA.connect(fc)
     comp.inputs.fields_containerB.connect(value.result_fields_container)
@@ -406,7 +406,7 @@ def test_displacement_complex(complex_model):
     assert vector._operator_name == "U"
     value = vector.vector
     assert np.allclose(
-        value[0].data[3].tolist(),
+        value[0].data[3],
         [2.534371453684853e-09, -5.736467209711275e-10, 6.357980303122968e-11],
     )
     x = vector.x
@@ -419,7 +419,7 @@ def test_displacement_complex(complex_model):
     assert np.isclose(nrm[0].data[34], 2.967925671058435e-09)
     value = vector.vector_amplitude
     assert np.allclose(
-        value[0].data[3].tolist(),
+        value[0].data[3],
         [2.5343714759693703e-09, 5.736467469384241e-10, 6.358000469996922e-11],
     )
     x = vector.x_amplitude
@@ -432,7 +432,7 @@ def test_displacement_complex(complex_model):
     assert np.isclose(nrm[0].data[34], 2.967925756112993e-09)
     value = vector.vector_at_phase(61.0)
     assert np.allclose(
-        value[0].data[3].tolist(),
+        value[0].data[3],
         [1.2283937136871685e-09, -2.7795848616806165e-10, 3.0964159956496574e-11],
     )
     x = vector.x_at_phase(61.0)
@@ -487,7 +487,7 @@ def test_stress(allkindofcomplexity):
     assert len(fc) == value.num_fields
     assert fc[0].location == value[0].location
     assert len(fc[0].data) == len(value[0].data)
-    assert np.allclose(value[0].data.tolist(), fc[0].data.tolist())
+    assert np.allclose(value[0].data, fc[0].data)
     comp = core.operators.logic.identical_fc()
     comp.inputs.fields_containerA.connect(fc)
     comp.inputs.fields_containerB.connect(value.result_fields_container)
@@ -502,7 +502,7 @@ def test_stress_complex(complex_model):
     assert tensor._operator_name == "S"
     value = tensor.tensor
     assert np.allclose(
-        value[0].data[3].tolist(),
+        value[0].data[3],
         [
             -1894.3998413085938,
             -99533.1953125,
@@ -635,7 +635,7 @@ def test_elastic_strain(allkindofcomplexity):
     assert len(fc) == value.num_fields
     assert fc[0].location == value[0].location
     assert len(fc[0].data) == len(value[0].data)
-    assert np.allclose(value[0].data.tolist(), fc[0].data.tolist())
+    assert np.allclose(value[0].data, fc[0].data)
     comp = core.operators.logic.identical_fc()
     comp.inputs.fields_containerA.connect(fc)
     comp.inputs.fields_containerB.connect(value.result_fields_container)
@@ -650,7 +650,7 @@ def test_elastic_strain_complex(complex_model):
     assert tensor._operator_name == "EPEL"
     value = tensor.tensor
     assert np.allclose(
-        value[0].data[3].tolist(),
+        value[0].data[3],
         [
             3.031909585615722e-07,
             -7.12252500534305e-07,
@@ -717,7 +717,7 @@ def test_temperature(allkindofcomplexity):
     assert len(fc) == value.num_fields
     assert fc[0].location == value[0].location
     assert len(fc[0].data) == len(value[0].data)
-    assert np.allclose(value[0].data.tolist(), fc[0].data.tolist())
+    assert np.allclose(value[0].data, fc[0].data)
     comp = core.operators.logic.identical_fc()
     comp.inputs.fields_containerA.connect(fc)
     comp.inputs.fields_containerB.connect(value.result_fields_container)
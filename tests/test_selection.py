@@ -34,45 +34,91 @@ from conftest import (
 )
 
 
-def test_spatial_selection_select_nodes(allkindofcomplexity):
-    simulation = post.load_simulation(allkindofcomplexity)
+# Entity ids shared between the select calls and the assertions, converted
+# to int32 arrays once at import time.
+_NODE_IDS = np.asarray([1, 2, 3], dtype=np.int32)
+_ELEMENT_IDS = np.asarray([1, 2, 3, 4], dtype=np.int32)
+_FACES_OF_FIRST_ELEMENT_PRE_9_1 = np.asarray(
+    [11479, 11500, -1, 11502, 11503], dtype=np.int32
+)
+_FACES_OF_FIRST_ELEMENT = np.asarray(
+    [12481, 12502, 39941, 43681, 12504, 12505], dtype=np.int32
+)
+
+
+def _make_selection():
+    """Return a SpatialSelection with its progress bar disabled."""
     selection = SpatialSelection()
     selection._selection.progress_bar = False
-    selection.select_nodes([1, 2, 3])
+    return selection
+
+
+@fixture(scope="module")
+def allkindofcomplexity_simulation():
+    """Load the "allKindOfComplexity" simulation once for the whole module."""
+    return post.load_simulation(examples.download_all_kinds_of_complexity())
+
+
+def test_spatial_selection_select_nodes(allkindofcomplexity_simulation):
+    simulation = allkindofcomplexity_simulation
+    selection = _make_selection()
+    selection.select_nodes(_NODE_IDS)
     scoping = selection._evaluate_on(simulation)
     assert scoping.location == post.locations.nodal
-    assert np.allclose(scoping.ids, [1, 2, 3])
+    assert np.array_equal(scoping.ids, _NODE_IDS)
 
 
-def test_spatial_selection_select_elements(allkindofcomplexity):
-    simulation = post.load_simulation(allkindofcomplexity)
-    selection = SpatialSelection()
-    selection._selection.progress_bar = False
-    selection.select_elements([1, 2, 3, 4])
+def test_spatial_selection_select_elements(allkindofcomplexity_simulation):
+    simulation = allkindofcomplexity_simulation
+    selection = _make_selection()
+    selection.select_elements(_ELEMENT_IDS)
     scoping = selection._evaluate_on(simulation)
     assert scoping.location == post.locations.elemental
-    assert np.allclose(scoping.ids, [1, 2, 3, 4])
+    assert np.array_equal(scoping.ids, _ELEMENT_IDS)
     ids = selection.apply_to(simulation)
-    assert np.allclose(ids, [1, 2, 3, 4])
+    assert np.array_equal(ids, _ELEMENT_IDS)
 
 
-def test_spatial_selection_select_named_selection(allkindofcomplexity):
-    simulation = post.load_simulation(allkindofcomplexity)
-    selection = SpatialSelection()
-    selection._selection.progress_bar = False
+def test_spatial_selection_select_named_selection(allkindofcomplexity_simulation):
+    simulation = allkindofcomplexity_simulation
+    selection = _make_selection()
     selection.select_named_selection(
         simulation.mesh.named_selections.keys()[0],
         location=post.selection.locations.nodal,
     )
     scoping = selection._evaluate_on(simulation)
     assert scoping.location == post.locations.nodal
-    assert scoping.ids.size == 12970
-    assert 1857 in scoping.ids
-    assert 14826 in scoping.ids
-    ids = selection.apply_to(simulation)
-    assert len(ids) == 12970
-    assert 1857 in ids
-    assert 14826 in ids
+    scoping_ids = scoping.ids
+    assert scoping_ids.size == 12970
+    assert np.isin([1857, 14826], scoping_ids).all()
+
+
+def _select_all_faces(selection, simulation):
+    face_ids = simulation.mesh.face_ids
+    selection.select_faces(face_ids)
+    return post.locations.faces, face_ids
+
+
+def _select_nodes_of_first_face(selection, simulation):
+    mesh = simulation.mesh
+    face_0 = mesh.faces[0]
+    selection.select_nodes_of_faces(
+        faces=[face_0.id],
+        mesh=mesh,
+    )
+    return post.locations.nodal, face_0.node_ids
+
+
+def _select_faces_of_first_element(selection, simulation):
+    mesh = simulation.mesh
+    elem_0 = mesh.elements[0]
+    selection.select_faces_of_elements(
+        elements=[elem_0.id],
+        mesh=mesh,
+    )
+    if not SERVERS_VERSION_GREATER_THAN_OR_EQUAL_TO_9_1:
+        return post.locations.faces, _FACES_OF_FIRST_ELEMENT_PRE_9_1
+    return post.locations.faces, _FACES_OF_FIRST_ELEMENT
 
 
 @pytest.mark.skipif(
@@ -80,7 +126,7 @@ def test_spatial_selection_select_named_selection(allkindofcomplexity):
     reason="Faces added with ansys-dpf-server 2024.1.pre0.",
 )
 class TestSpatialSelectionFaces:
-    @fixture
+    @fixture(scope="class")
     def fluent_simulation(self):
         fluid_example_files = examples.download_fluent_axial_comp()
         ds = dpf.DataSources()
@@ -94,56 +140,18 @@ class TestSpatialSelectionFaces:
         )
         return post.FluidSimulation(ds)  # noqa
 
-    def test_spatial_selection_select_faces(self, fluent_simulation):
-        selection = SpatialSelection()
-        selection._selection.progress_bar = False
-        selection.select_faces(fluent_simulation.mesh.face_ids)
-        scoping = selection._evaluate_on(fluent_simulation)
-        assert scoping.location == post.locations.faces
-        assert np.allclose(scoping.ids, fluent_simulation.mesh.face_ids)
-
-    def test_spatial_selection_select_nodes_of_faces(self, fluent_simulation):
-        selection = SpatialSelection()
-        selection._selection.progress_bar = False
-        face_0 = fluent_simulation.mesh.faces[0]
-        selection.select_nodes_of_faces(
-            faces=[face_0.id],
-            mesh=fluent_simulation.mesh,
-        )
-        scoping = selection._evaluate_on(fluent_simulation)
-        assert scoping.location == post.locations.nodal
-        assert np.allclose(scoping.ids, face_0.node_ids)
-
-    def test_spatial_selection_select_faces_of_elements(self, fluent_simulation):
-        selection = SpatialSelection()
-        selection._selection.progress_bar = False
-        elem_0 = fluent_simulation.mesh.elements[0]
-        selection.select_faces_of_elements(
-            elements=[elem_0.id],
-            mesh=fluent_simulation.mesh,
-        )
+    @pytest.mark.parametrize(
+        "builder",
+        [
+            _select_all_faces,
+            _select_nodes_of_first_face,
+            _select_faces_of_first_element,
+        ],
+        ids=["faces", "nodes_of_faces", "faces_of_elements"],
+    )
+    def test_spatial_selection_select(self, fluent_simulation, builder):
+        selection = _make_selection()
+        expected_location, expected_ids = builder(selection, fluent_simulation)
         scoping = selection._evaluate_on(fluent_simulation)
-        assert scoping.location == post.locations.faces
-        if not SERVERS_VERSION_GREATER_THAN_OR_EQUAL_TO_9_1:
-            list_ref = [11479, 11500, -1, 11502, 11503]
-        else:
-            list_ref = [12481, 12502, 39941, 43681, 12504, 12505]
-        assert np.allclose(scoping.ids, list_ref)
-
-
-#
-#
-# def test_spatial_selection_intersect(allkindofcomplexity):
-#     solution = post.load_solution(allkindofcomplexity, legacy=False)
-#     selection1 = SpatialSelection()
-#     selection1.select_nodes([1, 2, 3])
-#     _ = selection1._evaluate_on(solution)
-#
-#     selection = SpatialSelection()
-#     selection.select_nodes([1, 2, 3, 4])
-#     selection.intersect(selection1)
-#     scoping = selection._evaluate_on(solution)
-#     assert scoping.location == post.selection.locations.nodal
-#     assert np.allclose(scoping.ids, [1, 2, 3])
-#     ids = selection.apply_to(solution)
-#     assert np.allclose(ids, [1, 2, 3])
+        assert scoping.location == expected_location
+        assert np.array_equal(scoping.ids, expected_ids)
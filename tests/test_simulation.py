@@ -20,6 +20,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import contextlib
 import csv
 import dataclasses
 from itertools import groupby
@@ -53,11 +54,12 @@ from ansys.dpf.post.result_workflows._utils import (
     AveragingConfig,
     _CreateOperatorCallable,
 )
-from ansys.dpf.post.selection import _WfNames
+from ansys.dpf.post.selection import Selection, _WfNames
 from ansys.dpf.post.simulation import MechanicalSimulation, Simulation
 from conftest import (
     SERVERS_VERSION_GREATER_THAN_OR_EQUAL_TO_4_0,
     SERVERS_VERSION_GREATER_THAN_OR_EQUAL_TO_6_2,
+    SERVERS_VERSION_GREATER_THAN_OR_EQUAL_TO_7_0,
     SERVERS_VERSION_GREATER_THAN_OR_EQUAL_TO_7_1,
     SERVERS_VERSION_GREATER_THAN_OR_EQUAL_TO_8_0,
     SERVERS_VERSION_GREATER_THAN_OR_EQUAL_TO_9_0,
@@ -3196,6 +3198,90 @@ class TestModalMechanicalSimulation:
             assert len(result.index.mesh_index) == 11146
         assert len(result.columns.set_ids) == 1
 
+    def test_result_method_cache(self, modal_simulation):
+        result = modal_simulation.elemental_volume(set_ids=[2])
+        # Identical calls return the cached dataframe.
+        assert modal_simulation.elemental_volume(set_ids=[2]) is result
+        # The all-defaults fast path is cached as well.
+        default = modal_simulation.elemental_volume()
+        assert modal_simulation.elemental_volume() is default
+        assert modal_simulation._first_mode_result_cache
+        # A Selection hashes by identity and can be mutated in place, so
+        # selection-scoped calls bypass the cache.
+        selection = Selection()
+        selection.select_elements([1, 2, 3])
+        selected = modal_simulation.elemental_volume(selection=selection)
+        assert modal_simulation.elemental_volume(selection=selection) is not selected
+        # clear_result_cache empties both caches.
+        modal_simulation.clear_result_cache()
+        assert modal_simulation._result_method_cache == {}
+        assert modal_simulation._first_mode_result_cache == {}
+        assert modal_simulation.elemental_volume(set_ids=[2]) is not result
+
+    def test_iter_results(self, frame_modal_simulation):
+        n_sets = frame_modal_simulation.time_freq_support.n_sets
+        chunks = list(frame_modal_simulation.iter_results("displacement", chunk_size=4))
+        assert len(chunks) == (n_sets + 3) // 4
+        assert len(chunks[0].columns.set_ids) == min(n_sets, 4)
+        # Explicitly passing the documented defaults is allowed.
+        chunks = list(
+            frame_modal_simulation.iter_results(
+                "displacement", chunk_size=4, all_sets=False, modes=None
+            )
+        )
+        assert len(chunks) == (n_sets + 3) // 4
+        # Validation happens at call time, not on first iteration.
+        with pytest.raises(ValueError, match="strictly positive"):
+            frame_modal_simulation.iter_results("displacement", chunk_size=0)
+        with pytest.raises(ValueError, match="cannot be combined"):
+            frame_modal_simulation.iter_results("displacement", all_sets=True)
+        with pytest.raises(ValueError, match="not the name of a result"):
+            frame_modal_simulation.iter_results("_get_result")
+        with pytest.raises(ValueError, match="not the name of a result"):
+            frame_modal_simulation.iter_results("mesh")
+        with pytest.raises(ValueError, match="strictly positive"):
+            frame_modal_simulation.iter_plastic_strain(chunk_size=0)
+
+    def test_iter_results_bypasses_result_cache(self, modal_simulation):
+        # Chunked iteration over a memoized extractor must not retain the
+        # yielded dataframes, or peak memory would scale with the number of
+        # modes again.
+        iterator = modal_simulation.iter_results("elemental_volume", chunk_size=2)
+        next(iterator)
+        assert modal_simulation._result_method_cache == {}
+
+    def test_plastic_strain_all_locations_validation(self, frame_modal_simulation):
+        # The empty-scoping guard fires before any workflow is built.
+        with pytest.raises(ValueError, match="'node_ids' is an empty list"):
+            frame_modal_simulation.plastic_strain_all_locations(node_ids=[])
+
+    def test_plastic_strain_multi_validation(self, frame_modal_simulation):
+        with pytest.raises(ValueError, match="Invalid kinds \\['vm'\\]"):
+            frame_modal_simulation.plastic_strain_multi(kinds=["matrix", "vm"])
+        with pytest.raises(ValueError, match="duplicate"):
+            frame_modal_simulation.plastic_strain_multi(kinds=["eqv", "eqv"])
+
+    @pytest.mark.parametrize(
+        "arg_name", ["node_ids", "element_ids", "set_ids", "named_selections"]
+    )
+    def test_empty_list_argument(self, frame_modal_simulation, arg_name):
+        with pytest.raises(
+            ValueError, match=f"Argument '{arg_name}' is an empty list"
+        ):
+            frame_modal_simulation.displacement(**{arg_name: []})
+
+    @pytest.mark.skipif(
+        SERVERS_VERSION_GREATER_THAN_OR_EQUAL_TO_7_0,
+        reason="The multi-set skin warning only fires on pre-7.0 servers.",
+    )
+    def test_multi_set_skin_warning(self, frame_modal_simulation):
+        # The warning is emitted before the workflow is built; the extraction
+        # itself is expected to fail on these servers, which is the reason
+        # for warning early.
+        with pytest.warns(UserWarning, match="iter_results"):
+            with contextlib.suppress(Exception):
+                frame_modal_simulation.displacement(set_ids=[1, 2], skin=True)
+
 
 class TestHarmonicMechanicalSimulation:
     def test_cyclic(self, simple_cyclic):
@@ -49,7 +49,7 @@ def test_thermal_steadystate(rth_steady_state):
     assert len(fc) == s.num_fields
     assert fc[0].location == s[0].location
     assert len(fc[0].data) == len(s[0].data)
-    assert np.allclose(s[0].data.tolist(), fc[0].data.tolist())
+    assert np.allclose(s[0].data, fc[0].data)
     comp = core.operators.logic.identical_fc()
     comp.inputs.fields_containerA.connect(fc)
     comp.inputs.fields_containerB.connect(s.result_fields_container)
@@ -66,7 +66,7 @@ def test_steadystate_nodscoping(rth_steady_state):
     s = temp.scalar
     assert s.num_fields == 1
     assert len(s[0].data) == 2
-    assert np.allclose(s[0].data.tolist(), [41.8243869, 40.29943406])
+    assert np.allclose(s[0].data, [41.8243869, 40.29943406])
 
 
 @pytest.mark.skipif(True, reason="element scoping not available with thermal results.")
@@ -147,7 +147,7 @@ def test_transient_nodscoping(rth_transient):
     s = temp.scalar
     assert s.num_fields == 1
     assert len(s[0].data) == 2
-    assert np.allclose(s[0].data.tolist(), [27.01872925, 25.61222966])
+    assert np.allclose(s[0].data, [27.01872925, 25.61222966])
 
 
 @pytest.mark.skipif(True, reason="element scoping not available with thermal results.")
@@ -230,7 +230,7 @@ def test_heat_flux(rth_transient):
     assert len(fc) == s.num_fields
     assert fc[0].location == s[0].location
     assert len(fc[0].data) == len(s[0].data)
-    assert np.allclose(s[0].data.tolist(), fc[0].data.tolist())
+    assert np.allclose(s[0].data, fc[0].data)
     comp = core.operators.logic.identical_fc()
     comp.inputs.fields_containerA.connect(fc)
     comp.inputs.fields_containerB.connect(s.result_fields_container)